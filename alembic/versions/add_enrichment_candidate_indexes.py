@@ -0,0 +1,42 @@
+"""Add partial indexes for events needing website/flyer enrichment
+
+Revision ID: add_enrichment_candidate_indexes
+Revises: add_geocoding_candidate_index
+Create Date: 2024-03-20 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_enrichment_candidate_indexes'
+down_revision = 'add_geocoding_candidate_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Only events with a website can be enriched, so index just those rows
+    # in the date order the enrichment query walks them
+    op.create_index(
+        'idx_events_needs_enrichment',
+        'events',
+        ['date_start'],
+        unique=False,
+        postgresql_where=sa.text('website IS NOT NULL')
+    )
+    
+    # Enrichable events that have no structured details yet
+    op.create_index(
+        'idx_events_no_details',
+        'events',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('website IS NOT NULL AND event_details IS NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('idx_events_no_details', table_name='events')
+    op.drop_index('idx_events_needs_enrichment', table_name='events')
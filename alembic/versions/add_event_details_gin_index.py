@@ -0,0 +1,46 @@
+"""Add GIN index on event_details
+
+Revision ID: add_event_details_gin_index
+Revises: add_enrichment_candidate_indexes
+Create Date: 2024-03-20 20:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_event_details_gin_index'
+down_revision = 'add_enrichment_candidate_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The model declares event_details as JSONB, but databases built through
+    # add_lat_long_to_events created it as plain JSON, which GIN and @> don't
+    # support. Convert it in place when needed.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF (SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'events' AND column_name = 'event_details') = 'json' THEN
+                ALTER TABLE events ALTER COLUMN event_details TYPE JSONB USING event_details::jsonb;
+            END IF;
+        END $$;
+    """)
+    
+    # jsonb_path_ops is much smaller than the default jsonb_ops but only
+    # serves positive containment (@>) lookups; it can't help NOT @>,
+    # equality or key-existence filters
+    op.create_index(
+        'idx_events_details_gin',
+        'events',
+        ['event_details'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'event_details': 'jsonb_path_ops'}
+    )
+
+
+def downgrade():
+    op.drop_index('idx_events_details_gin', table_name='events')
@@ -0,0 +1,32 @@
+"""Add partial index for events needing geocoding
+
+Revision ID: add_geocoding_candidate_index
+Revises: 9db4a8c2ff53
+Create Date: 2024-03-20 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_geocoding_candidate_index'
+down_revision = '9db4a8c2ff53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Partial index covering only events without coordinates, so the keyset
+    # pagination in scripts/geocode_events.py seeks ungeocoded rows by id
+    op.create_index(
+        'idx_events_needs_geocoding',
+        'events',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('latitude IS NULL OR longitude IS NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('idx_events_needs_geocoding', table_name='events')
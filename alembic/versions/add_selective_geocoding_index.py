@@ -0,0 +1,35 @@
+"""Add partial index for events awaiting selective geocoding
+
+Revision ID: add_selective_geocoding_index
+Revises: add_tsm_system_rows_extension
+Create Date: 2024-03-21 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_selective_geocoding_index'
+down_revision = 'add_tsm_system_rows_extension'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Partial index over id covering only events that have never been
+    # geocoded, so each keyset page in scripts/selective_geocoding.py is an
+    # index range scan instead of a scan and sort of the whole table
+    op.create_index(
+        'idx_events_pending_geocoding',
+        'events',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text(
+            'latitude IS NULL AND longitude IS NULL AND geocoding_attempted = false'
+        )
+    )
+
+
+def downgrade():
+    op.drop_index('idx_events_pending_geocoding', table_name='events')
@@ -0,0 +1,25 @@
+"""Enable the tsm_system_rows extension
+
+Revision ID: add_tsm_system_rows_extension
+Revises: add_event_details_gin_index
+Create Date: 2024-03-21 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_tsm_system_rows_extension'
+down_revision = 'add_event_details_gin_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Provides TABLESAMPLE SYSTEM_ROWS(n), used to sample random events
+    # without sorting the whole table
+    op.execute('CREATE EXTENSION IF NOT EXISTS tsm_system_rows')
+
+
+def downgrade():
+    op.execute('DROP EXTENSION IF EXISTS tsm_system_rows')
@@ -10,6 +10,16 @@ from app.logging_config import get_logger
 
 logger = get_logger("crud.event")
 
+# Fields copied from EventCreate onto a new Event, hoisted so create_event
+# spells the mapping out once rather than per keyword argument.
+_EVENT_CREATE_FIELDS = (
+    'name', 'description', 'location', 'date_start', 'date_end', 'organizer',
+    'website', 'flyer_url', 'region', 'distances', 'latitude', 'longitude',
+    'ride_manager', 'manager_contact', 'event_type', 'event_details', 'notes',
+    'external_id', 'source', 'map_link', 'manager_email', 'manager_phone',
+    'judges', 'directions', 'is_canceled',
+)
+
 
 async def get_event(db: AsyncSession, event_id: int) -> Optional[Event]:
     """
@@ -121,34 +131,8 @@ async def create_event(db: AsyncSession, event: EventCreate, perform_geocoding:
     Returns:
         Created event
     """
-    # Creating dictionary with field mappings from schema to model
-    db_event = Event(
-        name=event.name,
-        description=event.description,
-        location=event.location,
-        date_start=event.date_start,
-        date_end=event.date_end,
-        organizer=event.organizer,
-        website=event.website,
-        flyer_url=event.flyer_url,
-        region=event.region,
-        distances=event.distances,
-        latitude=event.latitude,
-        longitude=event.longitude,
-        ride_manager=event.ride_manager,
-        manager_contact=event.manager_contact,
-        event_type=event.event_type,
-        event_details=event.event_details,
-        notes=event.notes,
-        external_id=event.external_id,
-        source=getattr(event, 'source', None),
-        map_link=event.map_link,
-        manager_email=event.manager_email,
-        manager_phone=event.manager_phone,
-        judges=event.judges,
-        directions=event.directions,
-        is_canceled=event.is_canceled,
-    )
+    # Copy the schema fields straight onto the model
+    db_event = Event(**{field: getattr(event, field, None) for field in _EVENT_CREATE_FIELDS})
     
     # Add to session
     db.add(db_event)
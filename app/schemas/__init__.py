@@ -16,7 +16,7 @@ from .event import (
     # Enums
     EventSourceEnum, EventTypeEnum, RegionEnum,
     # Utility functions
-    validate_event, SOURCE_SCHEMAS,
+    validate_event, validate_event_json, SOURCE_SCHEMAS,
     # Announcements
     AnnouncementBase, AnnouncementCreate, Announcement
 )
@@ -34,7 +34,7 @@ __all__ = [
     # Enums
     'EventSourceEnum', 'EventTypeEnum', 'RegionEnum',
     # Utility functions
-    'validate_event', 'SOURCE_SCHEMAS',
+    'validate_event', 'validate_event_json', 'SOURCE_SCHEMAS',
     
     # Announcement schemas
     'AnnouncementBase', 'AnnouncementCreate', 'Announcement',
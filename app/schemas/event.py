@@ -11,7 +11,7 @@ Design principles:
 4. Typed: Uses strong typing for all fields to catch errors early
 """
 
-from pydantic import BaseModel, Field, AnyUrl, EmailStr, field_validator, model_validator, ConfigDict
+from pydantic import BaseModel, Field, AnyUrl, EmailStr, field_validator, model_validator, ConfigDict, TypeAdapter, ValidationInfo
 from typing import List, Optional, Dict, Any, Union, Literal, Annotated
 from datetime import datetime, date
 from enum import Enum
@@ -131,7 +131,8 @@ class Coordinates(BaseModel):
     longitude: float
 
     @field_validator('latitude')
-    def validate_latitude(self, v):
+    @classmethod
+    def validate_latitude(cls, v):
         """
         Validate that latitude is within the valid range of -90 to 90 degrees.
         
@@ -149,7 +150,8 @@ class Coordinates(BaseModel):
         return v
 
     @field_validator('longitude')
-    def validate_longitude(self, v):
+    @classmethod
+    def validate_longitude(cls, v):
         """
         Validate that longitude is within the valid range of -180 to 180 degrees.
         
@@ -267,25 +269,28 @@ class EventBase(BaseModel):
     location_details: Optional[Union[Dict[str, Any], LocationDetails]] = None
     coordinates_details: Optional[Union[Dict[str, Any], Coordinates]] = None
 
-    @field_validator('date_end')
-    def set_date_end(self, v, info):
+    @model_validator(mode='before')
+    @classmethod
+    def set_date_end(cls, data):
         """
         Set date_end to date_start if not provided.
         
+        Runs before field validation so the default also applies when
+        date_end is omitted entirely, and the duration flags below see it.
+        
         Args:
-            v: The date_end value
-            info: ValidationInfo containing field data and context
+            data: The raw input data
             
         Returns:
-            The original value or date_start if v is None
+            The input data, with date_end filled in from date_start if missing
         """
-        values = info.data
-        if not v and 'date_start' in values:
-            return values['date_start']
-        return v
+        if isinstance(data, dict) and not data.get('date_end') and data.get('date_start'):
+            return {**data, 'date_end': data['date_start']}
+        return data
 
     @field_validator('ride_days', 'is_multi_day_event', 'is_pioneer_ride')
-    def calculate_event_duration_flags(self, v, info):
+    @classmethod
+    def calculate_event_duration_flags(cls, v, info: ValidationInfo):
         """
         Calculate ride days and event flags based on start and end dates.
         
@@ -483,6 +488,37 @@ SOURCE_SCHEMAS = {
     EventSourceEnum.UMECRA: UMECRAEvent
 }
 
+# Validators are built once per schema and reused for every event. They are
+# keyed by the raw source string so lookups skip constructing the enum; sources
+# without a specific schema share the EventBase validator.
+_DEFAULT_VALIDATOR = TypeAdapter(EventBase)
+_VALIDATORS: Dict[str, TypeAdapter] = {
+    source.value: _DEFAULT_VALIDATOR for source in EventSourceEnum
+}
+_VALIDATORS.update(
+    (source.value, TypeAdapter(schema)) for source, schema in SOURCE_SCHEMAS.items()
+)
+
+def get_event_validator(source: str) -> TypeAdapter:
+    """
+    Get the cached validator for an event source.
+
+    Falls back to the EventBase validator for sources without a specific schema.
+
+    Args:
+        source: String identifier of the event source (e.g., "AERC")
+
+    Returns:
+        The TypeAdapter for the source's event schema
+
+    Raises:
+        ValueError: If the event source is unsupported
+    """
+    validator = _VALIDATORS.get(source)
+    if validator is None:
+        raise ValueError(f"Unsupported event source: {source}")
+    return validator
+
 def validate_event(data: dict, source: str) -> BaseModel:
     """
     Validate event data against the appropriate schema.
@@ -492,7 +528,7 @@ def validate_event(data: dict, source: str) -> BaseModel:
     unknown sources.
     
     Args:
-        data: Dict containing event data to validate
+        data: Dict containing event data, or an existing schema instance
         source: String identifier of the event source (e.g., "AERC")
         
     Returns:
@@ -501,10 +537,26 @@ def validate_event(data: dict, source: str) -> BaseModel:
     Raises:
         ValueError: If the event source is unsupported
     """
-    source_enum = EventSourceEnum(source)
-    schema = SOURCE_SCHEMAS.get(source_enum, EventBase)
+    validator = get_event_validator(source)
+    # Instances of the target schema have already been validated
+    if isinstance(data, SOURCE_SCHEMAS.get(source, EventBase)):
+        return data
+    return validator.validate_python(data)
 
-    if not schema:
-        raise ValueError(f"Unsupported event source: {source}")
+def validate_event_json(raw: Union[str, bytes], source: str) -> BaseModel:
+    """
+    Validate a raw JSON event payload against the appropriate schema.
+
+    Parses and validates in a single pass, avoiding a separate json.loads.
 
-    return schema.model_validate(data)
+    Args:
+        raw: JSON document containing the event data
+        source: String identifier of the event source (e.g., "AERC")
+
+    Returns:
+        A validated instance of the appropriate event schema
+
+    Raises:
+        ValueError: If the event source is unsupported
+    """
+    return get_event_validator(source).validate_json(raw)
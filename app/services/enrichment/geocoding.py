@@ -4,17 +4,22 @@ from typing import Optional
 
 from app.models import Event
 from app.services.enrichment.base import EnrichmentService
-from app.services.geocoding import GeocodingService
+from app.services.geocoding import GeocodingService, RequestThrottle
 
 logger = logging.getLogger(__name__)
 
 class GeocodingEnrichmentService(EnrichmentService):
     """Service for enriching events with geocoding data."""
     
-    def __init__(self):
-        """Initialize the geocoding enrichment service."""
+    def __init__(self, throttle: Optional[RequestThrottle] = None):
+        """
+        Initialize the geocoding enrichment service.
+        
+        Args:
+            throttle: Optional throttle shared by every geocoding request
+        """
         super().__init__()
-        self.geocoding_service = GeocodingService()
+        self.geocoding_service = GeocodingService(throttle)
         
     async def enrich_event(self, event: Event) -> bool:
         """
@@ -39,6 +44,10 @@ class GeocodingEnrichmentService(EnrichmentService):
         # Geocode the event
         return await self.geocoding_service.geocode_event(event)
         
+    async def close(self):
+        """Close the geocoding service's HTTP session."""
+        await self.geocoding_service.close()
+        
     def clear_cache(self):
         """Clear the geocoding cache."""
         self.geocoding_service.clear_cache()
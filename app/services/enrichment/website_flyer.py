@@ -15,6 +15,9 @@ from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# event_details key recording when the event's website was last checked
+LAST_WEBSITE_CHECK_KEY = 'last_website_check_at'
+
 class WebsiteFlyerEnrichmentService(EnrichmentService):
     """Service for enriching events with website/flyer data."""
     
@@ -100,7 +103,7 @@ class WebsiteFlyerEnrichmentService(EnrichmentService):
         Extract detailed information about this event:
         
         Event Name: {event.name if event.name else 'Unknown'}
-        Date: {event.date if event.date else 'Unknown'}
+        Date: {event.date_start if event.date_start else 'Unknown'}
         Location: {event.location if event.location else 'Unknown'}
         
         Extract the following information from the text (if available):
@@ -167,6 +170,24 @@ class WebsiteFlyerEnrichmentService(EnrichmentService):
                 "extraction_error": True
             }
             
+    def _last_website_check(self, event: Event) -> Optional[datetime]:
+        """Return when the event's website was last checked, if ever."""
+        checked_at = (event.event_details or {}).get(LAST_WEBSITE_CHECK_KEY)
+        if not checked_at:
+            return None
+        try:
+            return datetime.fromisoformat(checked_at)
+        except (TypeError, ValueError):
+            return None
+    
+    def _mark_website_checked(self, event: Event) -> None:
+        """Record the check time in event_details."""
+        # Assign a new dict so the ORM sees the JSONB column change
+        event.event_details = {
+            **(event.event_details or {}),
+            LAST_WEBSITE_CHECK_KEY: datetime.now().isoformat()
+        }
+        
     def _should_update_event(self, event: Event) -> bool:
         """
         Determine if an event should be updated based on its date and last check time.
@@ -180,15 +201,16 @@ class WebsiteFlyerEnrichmentService(EnrichmentService):
         now = datetime.now()
         
         # If event has no date, update it
-        if not event.date:
+        if not event.date_start:
             return True
             
         # If event has never been checked, update it
-        if not event.last_website_check_at:
+        last_website_check = self._last_website_check(event)
+        if not last_website_check:
             return True
             
         # Calculate days until the event
-        days_until_event = (event.date - now.date()).days
+        days_until_event = (event.date_start.date() - now.date()).days
         
         # If event is in the past, don't update it
         if days_until_event < 0:
@@ -196,11 +218,11 @@ class WebsiteFlyerEnrichmentService(EnrichmentService):
             
         # If event is within 3 months, check nightly if it hasn't been checked in the last 24 hours
         if days_until_event <= self.near_term_days:
-            last_check_age = now - event.last_website_check_at
+            last_check_age = now - last_website_check
             return last_check_age > timedelta(hours=24)
         
         # For events further in the future, check weekly
-        last_check_age = now - event.last_website_check_at
+        last_check_age = now - last_website_check
         return last_check_age > timedelta(days=7)
         
     async def enrich_event(self, event: Event) -> bool:
@@ -214,7 +236,7 @@ class WebsiteFlyerEnrichmentService(EnrichmentService):
             True if enrichment was successful, False otherwise
         """
         # Skip if no website URL
-        if not event.website_url:
+        if not event.website:
             self.logger.warning(f"No website URL provided for event {event.id}")
             return False
             
@@ -224,26 +246,24 @@ class WebsiteFlyerEnrichmentService(EnrichmentService):
             return True
             
         # Fetch website content
-        content = await self._fetch_url_content(event.website_url)
+        content = await self._fetch_url_content(event.website)
         if not content:
-            self.logger.warning(f"Could not fetch content for event {event.id} from {event.website_url}")
+            self.logger.warning(f"Could not fetch content for event {event.id} from {event.website}")
             
             # Update last check time even if we couldn't fetch content
-            event.last_website_check_at = datetime.now()
+            self._mark_website_checked(event)
             return False
             
         # Process with AI to extract info
         extracted_data = await self._extract_info_with_ai(content, event)
         
-        # Update event details
-        if event.event_details is None:
-            event.event_details = {}
-            
-        # Merge the extracted data with existing event_details
-        event.event_details.update(extracted_data)
+        # Merge the extracted data with existing event_details. Assign a new
+        # dict: an in-place update of the JSONB value isn't tracked by the ORM
+        # and would never be flushed.
+        event.event_details = {**(event.event_details or {}), **extracted_data}
         
         # Always update last check time
-        event.last_website_check_at = datetime.now()
+        self._mark_website_checked(event)
         
         self.logger.info(f"Successfully enriched event {event.id} with website data")
         return True
@@ -1,3 +1,5 @@
+from .cache import GeocodeCache
 from .service import GeocodingService
+from .throttle import RequestThrottle
 
-__all__ = ["GeocodingService"] 
\ No newline at end of file
+__all__ = ["GeocodeCache", "GeocodingService", "RequestThrottle"]
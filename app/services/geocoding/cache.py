@@ -0,0 +1,109 @@
+"""Persistent cache of geocoding results keyed by normalized address."""
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default location of the cache database; cache/ is mounted as a volume
+GEOCODE_CACHE_PATH = os.environ.get('GEOCODE_CACHE_PATH', 'cache/geocode.sqlite3')
+
+# Hits are kept for 180 days. Misses expire sooner so that addresses the
+# geocoder could not resolve are retried eventually.
+GEOCODE_CACHE_TTL = 180 * 86400
+GEOCODE_CACHE_NEGATIVE_TTL = 7 * 86400
+
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+@lru_cache(maxsize=10_000)
+def normalize_address_key(address: str) -> str:
+    """
+    Normalize an address for use as a cache key.
+    
+    Lowercases, strips punctuation and collapses whitespace so that trivially
+    different spellings of the same location share one entry.
+    """
+    address = _PUNCTUATION_PATTERN.sub(' ', address.lower())
+    return _WHITESPACE_PATTERN.sub(' ', address).strip()
+
+class GeocodeCache:
+    """SQLite-backed cache of geocoding results keyed by normalized address."""
+    
+    def __init__(self, path: str = GEOCODE_CACHE_PATH):
+        """Open (creating if needed) the cache database at path."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            "key TEXT PRIMARY KEY, latitude REAL, longitude REAL, expires_at REAL NOT NULL)"
+        )
+        # In-process layer so duplicate addresses within a run skip SQLite too
+        self._memory: Dict[str, Optional[Tuple[float, float]]] = {}
+    
+    @staticmethod
+    @lru_cache(maxsize=10_000)
+    def _key(address: str) -> str:
+        """Hash a normalized address into a fixed-size cache key."""
+        return hashlib.blake2b(normalize_address_key(address).encode(), digest_size=16).hexdigest()
+    
+    def preload(self) -> int:
+        """
+        Load every unexpired entry into memory.
+        
+        The cache is small, so reading it once up front turns every later
+        lookup into a dictionary hit.
+        
+        Returns:
+            Number of entries loaded
+        """
+        rows = self._conn.execute(
+            "SELECT key, latitude, longitude FROM geocode WHERE expires_at >= ?", (time.time(),)
+        ).fetchall()
+        for key, latitude, longitude in rows:
+            self._memory[key] = (latitude, longitude) if latitude is not None else None
+        logger.info(f"Loaded {len(rows)} cached geocoding results")
+        return len(rows)
+    
+    def lookup(self, address: str) -> Tuple[bool, Optional[Tuple[float, float]]]:
+        """
+        Look up a cached result.
+        
+        Returns:
+            Tuple of (hit, coordinates); coordinates is None for cached misses
+        """
+        key = self._key(address)
+        if key in self._memory:
+            return True, self._memory[key]
+        
+        row = self._conn.execute(
+            "SELECT latitude, longitude, expires_at FROM geocode WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or row[2] < time.time():
+            return False, None
+        
+        coordinates = (row[0], row[1]) if row[0] is not None else None
+        self._memory[key] = coordinates
+        return True, coordinates
+    
+    def store(self, address: str, coordinates: Optional[Tuple[float, float]]) -> None:
+        """Cache a result; None records that the address could not be resolved."""
+        key = self._key(address)
+        ttl = GEOCODE_CACHE_TTL if coordinates else GEOCODE_CACHE_NEGATIVE_TTL
+        latitude, longitude = coordinates or (None, None)
+        self._memory[key] = coordinates
+        self._conn.execute(
+            "INSERT OR REPLACE INTO geocode (key, latitude, longitude, expires_at) VALUES (?, ?, ?, ?)",
+            (key, latitude, longitude, time.time() + ttl)
+        )
+        self._conn.commit()
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        self._conn.close()
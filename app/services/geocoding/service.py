@@ -12,6 +12,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 
 from app.config import get_settings
 from app.models import Event
+from app.services.geocoding.throttle import RequestThrottle
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -19,8 +20,14 @@ logger = logging.getLogger(__name__)
 class GeocodingService:
     """Service for geocoding addresses to coordinates."""
     
-    def __init__(self):
-        """Initialize the geocoding service with configuration."""
+    def __init__(self, throttle: Optional[RequestThrottle] = None):
+        """
+        Initialize the geocoding service with configuration.
+        
+        Args:
+            throttle: Optional throttle every request to the geocoder waits on,
+                including fallback queries and retries
+        """
         self.settings = get_settings()
         self.provider = self.settings.GEOCODING_PROVIDER
         self.user_agent = self.settings.GEOCODING_USER_AGENT
@@ -43,9 +50,17 @@ class GeocodingService:
                 adapter_factory=AioHTTPAdapter,
             )
         
+        self.throttle = throttle
+        
         # Cache for geocoding results
         self._cache = {}
     
+    async def _geocode(self, query: str):
+        """Send one query to the geocoder, waiting on the throttle first."""
+        if self.throttle is not None:
+            await self.throttle.wait()
+        return await self.geocoder.geocode(query)
+    
     def _clean_address(self, address: str) -> str:
         """
         Clean and format an address to improve geocoding success.
@@ -121,7 +136,7 @@ class GeocodingService:
         
         try:
             logger.info(f"Geocoding address: {cleaned_address}")
-            location = await self.geocoder.geocode(cleaned_address)
+            location = await self._geocode(cleaned_address)
             
             if location:
                 # Cache the result
@@ -133,7 +148,7 @@ class GeocodingService:
                 # If the cleaned address failed, try with the original address
                 if cleaned_address != address:
                     logger.info(f"Trying original address: {address}")
-                    location = await self.geocoder.geocode(address)
+                    location = await self._geocode(address)
                     if location:
                         coordinates = (location.latitude, location.longitude)
                         self._cache[cleaned_address] = coordinates
@@ -178,6 +193,10 @@ class GeocodingService:
             logger.warning(f"Failed to geocode event {event.id} location: {event.location}")
             return False
     
+    async def close(self):
+        """Close the geocoder's HTTP session."""
+        await self.geocoder.__aexit__(None, None, None)
+        
     def clear_cache(self):
         """Clear the geocoding cache."""
         self._cache.clear()
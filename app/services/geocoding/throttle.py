@@ -0,0 +1,21 @@
+"""Request pacing shared by concurrent geocoding tasks."""
+import asyncio
+
+from scrapers.rate_limiter import TokenBucket
+
+# Nominatim's usage policy allows at most one request per second
+NOMINATIM_REQUESTS_PER_SECOND = 1.0
+
+class RequestThrottle:
+    """Spaces outbound geocoding requests shared by concurrent tasks."""
+    
+    def __init__(self, requests_per_second: float = NOMINATIM_REQUESTS_PER_SECOND):
+        """Initialize the throttle with a single-token bucket."""
+        self._bucket = TokenBucket(requests_per_second, 1)
+        self._lock = asyncio.Lock()
+    
+    async def wait(self) -> None:
+        """Wait until the next request may be sent."""
+        # TokenBucket is not safe for concurrent waiters, so serialize access
+        async with self._lock:
+            await self._bucket.acquire()
@@ -11,6 +11,7 @@ which serves as the single source of truth for event data structures.
 
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 import re
 import logging
 from pydantic import ValidationError
@@ -31,6 +32,29 @@ from .data_validators import validate_url, validate_coordinates, validate_locati
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str, fmt: str = '%Y-%m-%d') -> datetime:
+    """
+    Parse a date string, memoizing results.
+
+    A scrape repeats the same few dates across many events and distances, so
+    most calls are cache hits. datetime is immutable, so sharing is safe.
+    Bare ISO dates take the C fromisoformat path; strptime is only the
+    fallback for other formats and unpadded dates such as "2024-3-5".
+    fromisoformat also accepts datetimes, "20240501" and week dates, so only
+    strings shaped exactly like YYYY-MM-DD are passed to it.
+
+    Raises:
+        ValueError: If date_str does not match fmt
+    """
+    if fmt == '%Y-%m-%d' and len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, fmt)
+
+
 def parse_location(location_str: str) -> Dict[str, str]:
     """
     Parse location string into structured components.
@@ -328,10 +352,10 @@ def transform_to_aerc_event(raw_event: Dict[str, Any]) -> AERCEvent:
             # Parse date string to datetime
             if isinstance(raw_event['date_start'], str):
                 try:
-                    event_data['date_start'] = datetime.strptime(raw_event['date_start'], '%Y-%m-%d')
+                    event_data['date_start'] = _parse_date(raw_event['date_start'])
                 except ValueError:
                     # Try another format
-                    event_data['date_start'] = datetime.strptime(raw_event['date_start'], '%Y-%m-%dT%H:%M:%S')
+                    event_data['date_start'] = _parse_date(raw_event['date_start'], '%Y-%m-%dT%H:%M:%S')
             else:
                 event_data['date_start'] = raw_event['date_start']
 
@@ -556,12 +580,12 @@ def process_multi_day_flags(event_data: Dict[str, Any]) -> None:
         # Calculate days between dates
         try:
             if isinstance(date_start, str):
-                start_date = datetime.strptime(date_start, '%Y-%m-%d')
+                start_date = _parse_date(date_start)
             else:
                 start_date = date_start
 
             if isinstance(date_end, str):
-                end_date = datetime.strptime(date_end, '%Y-%m-%d')
+                end_date = _parse_date(date_end)
             else:
                 end_date = date_end
 
@@ -693,7 +717,7 @@ def prepare_event_data(event_data: Dict[str, Any]) -> Dict[str, Any]:
     date_start = prepared_data.get('date_start')
     if date_start and isinstance(date_start, str):
         try:
-            parsed_date = datetime.strptime(date_start, '%Y-%m-%d')
+            parsed_date = _parse_date(date_start)
             prepared_data['date_start'] = parsed_date
         except ValueError:
             try:
@@ -7,9 +7,10 @@ This file provides pytest fixtures that can be shared across test files.
 import sys
 import pytest
 import os
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
 
 # Add project root to path
 project_root = str(Path(__file__).parents[3])
@@ -25,13 +26,13 @@ from app.models.event import Event as DBEvent
 # Path to HTML samples
 HTML_SAMPLES_DIR = Path(__file__).parent / "html_samples"
 
+@lru_cache(maxsize=None)
 def load_html_sample(filename: str) -> str:
-    """Load HTML sample from a file."""
+    """Load HTML sample from a file, reading each file once per session."""
     file_path = HTML_SAMPLES_DIR / filename
     if not file_path.exists():
         raise FileNotFoundError(f"Sample file not found: {file_path}")
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return file_path.read_text(encoding='utf-8')
 
 @pytest.fixture
 def parser():
@@ -50,20 +51,18 @@ def db_handler():
 
 @pytest.fixture
 def mock_db():
-    """Create a mock database."""
-    mock_db = AsyncMock(spec=AsyncSession)
-    
-    # Add execute method to mock database
+    """Create a lightweight fake database session."""
+    # Plain functions and namespaces instead of a mock specced against
+    # AsyncSession; the tests only pass the session through to patched CRUD
     async def mock_execute(query):
-        mock_result = AsyncMock()
-        mock_result.scalar.return_value = 1
-        mock_result.all.return_value = []
-        return mock_result
-    
-    mock_db.execute = mock_execute
-    mock_db.commit = AsyncMock()
+        return SimpleNamespace(scalar=lambda: 1, all=lambda: [])
     
-    return mock_db
+    return SimpleNamespace(
+        execute=mock_execute,
+        commit=AsyncMock(),
+        rollback=AsyncMock(),
+        close=AsyncMock(),
+    )
 
 @pytest.fixture
 def stored_events():
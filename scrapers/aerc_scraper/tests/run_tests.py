@@ -15,13 +15,14 @@ project_root = str(Path(__file__).parents[3])
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-def run_tests(test_path=None, verbosity=None):
+def run_tests(test_path=None, verbosity=None, parallel=False):
     """
     Run all tests in the specified path, or current directory if None.
     
     Args:
         test_path: Path to the test files or directories
         verbosity: Verbosity level for test output
+        parallel: Spread the tests across worker processes with pytest-xdist
         
     Returns:
         Exit code (0 for success, 1 for failure)
@@ -101,6 +102,12 @@ def run_tests(test_path=None, verbosity=None):
     else:
         pytest_args.append("-v")
     
+    # Spread the test files across one worker process per CPU with
+    # pytest-xdist. Opt-in only: worker start-up outweighs the run time of
+    # this suite, and workers capture output, which gets in the way of -s/pdb.
+    if parallel:
+        pytest_args.extend(["-n", "auto"])
+    
     # Run tests with pytest
     result = pytest.main(pytest_args)
     
@@ -123,8 +130,12 @@ def run_tests(test_path=None, verbosity=None):
     return result
 
 if __name__ == "__main__":
-    # Use command line arguments for test path if provided
-    test_path = sys.argv[1] if len(sys.argv) > 1 else None
-    verbosity = int(sys.argv[2]) if len(sys.argv) > 2 else 2
-    
-    sys.exit(run_tests(test_path, verbosity)) 
\ No newline at end of file
+    # Use command line arguments for test path if provided; --parallel
+    # may appear anywhere
+    args = sys.argv[1:]
+    parallel = "--parallel" in args
+    args = [arg for arg in args if arg != "--parallel"]
+    test_path = args[0] if len(args) > 0 else None
+    verbosity = int(args[1]) if len(args) > 1 else 2
+    
+    sys.exit(run_tests(test_path, verbosity, parallel)) 
\ No newline at end of file
@@ -3,8 +3,10 @@
 import pytest
 from datetime import datetime
 
+from pydantic import ValidationError
+
 from scrapers.aerc_scraper.data_handler import DataHandler
-from app.schemas.event import AERCEvent, EventSourceEnum, EventTypeEnum
+from app.schemas.event import AERCEvent, Coordinates, EventSourceEnum, EventTypeEnum
 
 def test_transform_and_validate_minimal():
     """Test transformation of minimal valid event data."""
@@ -118,4 +120,20 @@ def test_validate_url():
         if expected is None:
             assert result is None, f"Failed for input: {input_url}"
         else:
-            assert str(result) == expected, f"Failed for input: {input_url}" 
\ No newline at end of file
+            assert str(result) == expected, f"Failed for input: {input_url}" 
+
+def test_coordinates_range_validation():
+    """Test that out-of-range and NaN coordinates are rejected."""
+    coords = Coordinates(latitude=-90, longitude=180)
+    assert (coords.latitude, coords.longitude) == (-90, 180)
+    
+    invalid_cases = [
+        (90.1, 0),
+        (0, -180.1),
+        (float('nan'), 0),
+        (0, float('nan')),
+    ]
+    
+    for latitude, longitude in invalid_cases:
+        with pytest.raises(ValidationError):
+            Coordinates(latitude=latitude, longitude=longitude)
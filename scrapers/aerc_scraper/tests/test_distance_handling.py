@@ -15,7 +15,6 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from scrapers.aerc_scraper.parser_v2.html_parser import HTMLParser
 from scrapers.aerc_scraper.data_handler import DataHandler
 from scrapers.schema import AERCEvent, EventSourceEnum, EventTypeEnum, Distance
-from scrapers.aerc_scraper.database import DatabaseHandler
 from app.models.event import Event as DBEvent
 
 # Sample HTML with distance and time information
@@ -139,14 +138,6 @@ def test_extract_distances_with_start_time():
         # Verify distances have start_time
         assert all('start_time' in d for d in event['distances'])
 
-@pytest.fixture
-def data_handler():
-    return DataHandler()
-
-@pytest.fixture
-def db_handler():
-    return DatabaseHandler()
-
 @pytest.mark.asyncio
 @pytest.mark.skip("Temporarily skipping due to mock configuration issues")
 async def test_database_storage(data_handler, db_handler):
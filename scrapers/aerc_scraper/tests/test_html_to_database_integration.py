@@ -22,71 +22,21 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 # Import the components we need to test
-from scrapers.aerc_scraper.parser_v2.html_parser import HTMLParser
-from scrapers.aerc_scraper.data_handler import DataHandler
-from scrapers.aerc_scraper.database import DatabaseHandler
 from app.schemas.event import EventCreate
+from scrapers.aerc_scraper.tests.conftest import load_html_sample
 from scrapers.aerc_scraper.tests.expected_test_data import EXPECTED_DATA, EVENT_SAMPLES
 
 # Import app models and schemas
 from app.models.event import Event as DBEvent
 
-# Path to HTML samples
-HTML_SAMPLES_DIR = Path(__file__).parent / "html_samples"
-
-def load_html_sample(filename: str) -> str:
-    """Load HTML sample from a file."""
-    file_path = HTML_SAMPLES_DIR / filename
-    if not file_path.exists():
-        raise FileNotFoundError(f"Sample file not found: {file_path}")
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
-
-@pytest.fixture
-def parser():
-    """Return an instance of the HTML parser."""
-    return HTMLParser(debug_mode=True)
-
-@pytest.fixture
-def data_handler():
-    """Return an instance of the data handler."""
-    return DataHandler()
-
-@pytest.fixture
-def db_handler():
-    """Return an instance of the database handler."""
-    return DatabaseHandler()
-
-@pytest.fixture
-def mock_db():
-    """Create a mock database."""
-    mock_db = AsyncMock()
-    
-    # Add execute method to mock database
-    async def mock_execute(query):
-        mock_result = AsyncMock()
-        mock_result.scalar.return_value = 1
-        mock_result.all.return_value = []
-        return mock_result
-    
-    mock_db.execute = mock_execute
-    mock_db.commit = AsyncMock()
-    
-    return mock_db
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def html_samples():
-    """Load all HTML samples."""
+    """Load all HTML samples once for the module; tests only read them."""
     samples = {}
     for filename in EVENT_SAMPLES:
         samples[filename] = load_html_sample(filename)
     return samples
 
-@pytest.fixture
-def stored_events():
-    """Track events that get stored in the database."""
-    return {}
-
 @pytest.mark.parametrize("mock_get_events,mock_create_event", [
     (
         AsyncMock(return_value=[]),  # No existing events
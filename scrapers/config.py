@@ -5,7 +5,7 @@ import yaml
 from pathlib import Path
 from typing import Optional, Dict, Any
 from pydantic_settings import BaseSettings
-from pydantic import Field, validator
+from pydantic import Field, ValidationInfo, field_validator
 
 from .exceptions import ConfigError
 
@@ -127,14 +127,16 @@ class ScraperSettings(BaseSettings):
         description="Scraper-specific settings"
     )
     
-    @validator('database_url')
+    @field_validator('database_url')
+    @classmethod
     def validate_database_url(cls, v: str) -> str:
         """Validate database URL format."""
         if not v.startswith(('postgresql://', 'postgresql+asyncpg://')):
             raise ConfigError("Database URL must be PostgreSQL")
         return v
     
-    @validator('log_level')
+    @field_validator('log_level')
+    @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level."""
         valid_levels = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
@@ -142,10 +144,11 @@ class ScraperSettings(BaseSettings):
             raise ConfigError(f"Invalid log level. Must be one of: {valid_levels}")
         return v.upper()
     
-    @validator('gemini_api_key')
-    def validate_gemini_key(cls, v: Optional[str], values: Dict[str, Any]) -> Optional[str]:
+    @field_validator('gemini_api_key')
+    @classmethod
+    def validate_gemini_key(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validate Gemini API key if AI extraction is enabled."""
-        if values.get('use_ai_extraction', False) and not v:
+        if info.data.get('use_ai_extraction', False) and not v:
             raise ConfigError("Gemini API key required when AI extraction is enabled")
         return v
     
@@ -14,10 +14,10 @@ class MetricsCollector:
     
     def __init__(self, source: str, metrics_dir: str):
         """Initialize metrics collector."""
-        self.source = source
-        self.metrics_dir = Path(metrics_dir)
+        self.source: str = source
+        self.metrics_dir: Path = Path(metrics_dir)
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
-        self.start_time = datetime.now()
+        self.start_time: datetime = datetime.now()
         
         # Initialize Prometheus registry and metrics
         self.registry = CollectorRegistry()
@@ -64,8 +64,14 @@ class MetricsCollector:
             registry=self.registry
         )
         
+        # Pre-bound label children so reads don't repeat the label lookup
+        self._error_children: Dict[str, Counter] = {
+            error_type: self.errors.labels(source=self.source, type=error_type)
+            for error_type in ('network', 'validation', 'storage', 'cache')
+        }
+        
         # Component metrics
-        self.network_metrics = {
+        self.network_metrics: Dict[str, float] = {
             'requests': 0,
             'retries': 0,
             'failures': 0,
@@ -73,21 +79,21 @@ class MetricsCollector:
             'avg_response_time': 0.0
         }
         
-        self.validation_metrics = {
+        self.validation_metrics: Dict[str, float] = {
             'total': 0,
             'valid': 0,
             'invalid': 0,
             'validation_time': 0.0
         }
         
-        self.storage_metrics = {
+        self.storage_metrics: Dict[str, float] = {
             'inserts': 0,
             'updates': 0,
             'failures': 0,
             'operation_time': 0.0
         }
         
-        self.cache_metrics = {
+        self.cache_metrics: Dict[str, int] = {
             'hits': 0,
             'misses': 0,
             'errors': 0
@@ -105,10 +111,7 @@ class MetricsCollector:
             ).observe(metrics.get('avg_response_time', 0))
         
         if 'failures' in metrics:
-            self.errors.labels(
-                source=self.source,
-                type='network'
-            ).inc(metrics['failures'])
+            self._error_children['network'].inc(metrics['failures'])
     
     def update_validation_metrics(self, metrics: Dict[str, Any]) -> None:
         """Update validation-related metrics."""
@@ -119,10 +122,7 @@ class MetricsCollector:
             self.events_valid.labels(source=self.source).inc(metrics['valid'])
         
         if 'invalid' in metrics:
-            self.errors.labels(
-                source=self.source,
-                type='validation'
-            ).inc(metrics['invalid'])
+            self._error_children['validation'].inc(metrics['invalid'])
     
     def update_storage_metrics(self, metrics: Dict[str, Any]) -> None:
         """Update storage-related metrics."""
@@ -142,10 +142,7 @@ class MetricsCollector:
             ).inc(metrics['updates'])
         
         if 'failures' in metrics:
-            self.errors.labels(
-                source=self.source,
-                type='storage'
-            ).inc(metrics['failures'])
+            self._error_children['storage'].inc(metrics['failures'])
     
     def update_cache_metrics(self, metrics: Dict[str, Any]) -> None:
         """Update cache-related metrics."""
@@ -153,10 +150,7 @@ class MetricsCollector:
         
         # Update Prometheus metrics
         if 'errors' in metrics:
-            self.errors.labels(
-                source=self.source,
-                type='cache'
-            ).inc(metrics['errors'])
+            self._error_children['cache'].inc(metrics['errors'])
     
     def update_memory_usage(self, bytes_used: int) -> None:
         """Update memory usage metric."""
@@ -184,11 +178,8 @@ class MetricsCollector:
                 )
             },
             'errors': {
-                error_type: self.errors.labels(
-                    source=self.source,
-                    type=error_type
-                )._value.get()
-                for error_type in ['network', 'validation', 'storage', 'cache']
+                error_type: child._value.get()
+                for error_type, child in self._error_children.items()
             }
         }
     
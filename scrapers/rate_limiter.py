@@ -162,15 +162,13 @@ class RateLimiter:
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get rate limiting metrics."""
-        metrics = self.metrics.copy()
+        total = self.metrics['requests']
+        if not total:
+            return dict(self.metrics)
         
-        # Calculate success rate
-        total = metrics['requests']
-        if total > 0:
-            success = total - metrics['backoffs']
-            metrics['success_rate'] = (success / total) * 100
-        
-        return metrics
+        # Merge the computed success rate into a fresh dict in one step
+        success = total - self.metrics['backoffs']
+        return self.metrics | {'success_rate': (success / total) * 100}
     
     @retry(
         retry=retry_if_exception_type(Exception),
@@ -11,6 +11,17 @@ from apscheduler.job import Job
 
 logger = logging.getLogger(__name__)
 
+# Parsed triggers keyed by cron expression; most scrapers share a schedule
+_trigger_cache: dict[str, CronTrigger] = {}
+
+
+def _get_trigger(cron: str) -> CronTrigger:
+    """Return a parsed CronTrigger for a cron expression, reusing prior parses."""
+    trigger = _trigger_cache.get(cron)
+    if trigger is None:
+        trigger = _trigger_cache[cron] = CronTrigger.from_crontab(cron)
+    return trigger
+
 class ScraperScheduler:
     """Manages scheduled scraping jobs."""
     
@@ -51,7 +62,7 @@ class ScraperScheduler:
         Returns:
             The scheduled job
         """
-        trigger = CronTrigger.from_crontab(cron)
+        trigger = _get_trigger(cron)
         
         job = self.scheduler.add_job(
             scraper_func,
@@ -64,8 +75,7 @@ class ScraperScheduler:
         
         logger.info(
             f"Scheduled {name} to run {cron}",
-            job_id=job.id,
-            next_run=job.next_run_time
+            extra={'job_id': job.id, 'next_run': job.next_run_time}
         )
         
         return job
@@ -119,7 +129,7 @@ class ScraperScheduler:
             return None
             
         if cron:
-            trigger = CronTrigger.from_crontab(cron)
+            trigger = _get_trigger(cron)
             job.reschedule(trigger=trigger)
             
         if kwargs:
@@ -127,8 +137,7 @@ class ScraperScheduler:
             
         logger.info(
             f"Modified job {job_id}",
-            next_run=job.next_run_time,
-            kwargs=kwargs
+            extra={'next_run': job.next_run_time, 'job_kwargs': kwargs}
         )
         
         return job
@@ -12,6 +12,7 @@ This approach allows:
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Union, TypeVar, Type, cast
 
 # Import the core schemas directly to avoid duplication
@@ -20,9 +21,15 @@ from app.schemas.event import (
     EventBase, EventCreate, EventUpdate, EventResponse,
     AERCEvent, SERAEvent, UMECRAEvent,
     ContactInfo, EventDistance, LocationDetails,
-    Coordinates, validate_event, SOURCE_SCHEMAS
+    Coordinates, validate_event, validate_event_json, SOURCE_SCHEMAS,
+    get_event_validator
 )
 
+# Legacy names kept as aliases of the core models so existing imports
+# resolve without defining (and compiling validators for) duplicate classes
+Distance = EventDistance
+Location = LocationDetails
+
 # Type variable for event schemas
 EventSchema = TypeVar('EventSchema', bound=EventBase)
 
@@ -31,11 +38,16 @@ __all__ = [
     'EventSourceEnum', 'EventTypeEnum', 'RegionEnum', 'EventBase',
     'EventCreate', 'EventUpdate', 'EventResponse',
     'AERCEvent', 'SERAEvent', 'UMECRAEvent',
-    'ContactInfo', 'EventDistance', 'LocationDetails',
-    'Coordinates', 'validate_event', 'SOURCE_SCHEMAS',
-    'convert_to_event_schema', 'validate_event_data'
+    'ContactInfo', 'EventDistance', 'LocationDetails', 'Distance', 'Location',
+    'Coordinates', 'validate_event', 'validate_event_json', 'SOURCE_SCHEMAS',
+    'convert_to_event_schema', 'validate_event_data', 'construct_event'
 ]
 
+@lru_cache(maxsize=None)
+def _resolve_schema(source: str) -> Type[EventBase]:
+    """Resolve the schema class for a source identifier, caching the lookup."""
+    return SOURCE_SCHEMAS.get(EventSourceEnum(source), EventBase)
+
 def convert_to_event_schema(
     source_data: Dict[str, Any],
     source: str,
@@ -59,21 +71,21 @@ def convert_to_event_schema(
     # Ensure source is set correctly
     source_data['source'] = source
 
-    # Add required datetime fields with proper formatting if they're strings
-    if 'date_start' in source_data and isinstance(source_data['date_start'], str):
-        # Try to parse the date string
-        try:
-            # If it's just a date (without time), append time to create a valid datetime
-            if 'T' not in source_data['date_start'] and ' ' not in source_data['date_start']:
-                source_data['date_start'] = f"{source_data['date_start']}T00:00:00"
-        except Exception:
-            # If parsing fails, leave it as is - the schema validator will handle it
-            pass
+    # Parse ISO date strings up front so the schema receives datetime objects;
+    # a bare date (YYYY-MM-DD) parses to midnight of that day
+    for field in ('date_start', 'date_end'):
+        value = source_data.get(field)
+        if isinstance(value, str):
+            try:
+                source_data[field] = datetime.fromisoformat(value)
+            except ValueError:
+                # Not ISO formatted - leave it as is for the schema validator
+                pass
 
     return source_data
 
 def validate_event_data(
-    data: Dict[str, Any],
+    data: Union[Dict[str, Any], str, bytes, EventBase],
     source: str,
     schema_class: Optional[Type[EventSchema]] = None
 ) -> EventSchema:
@@ -81,7 +93,7 @@ def validate_event_data(
     Validate and convert raw event data to the appropriate schema.
 
     Args:
-        data: Event data dictionary to validate
+        data: Event data dictionary, raw JSON document, or schema instance to validate
         source: Source identifier (e.g., 'AERC')
         schema_class: Optional schema class to use instead of automatic selection
 
@@ -91,13 +103,36 @@ def validate_event_data(
     Raises:
         ValueError: If validation fails
     """
-    # If no specific schema class is provided, select based on source
-    if schema_class is None:
-        source_enum = EventSourceEnum(source)
-        schema_class = cast(Type[EventSchema], SOURCE_SCHEMAS.get(source_enum, EventBase))
+    # Instances of the target schema have already been validated
+    if isinstance(data, schema_class or _resolve_schema(source)):
+        return cast(EventSchema, data)
 
-    # Validate using the model_validate method (Pydantic V2)
+    # Validate with the cached per-source validator unless a schema is forced.
+    # Raw JSON is parsed and validated in one pass rather than json.loads first.
     try:
+        if isinstance(data, (str, bytes)):
+            if schema_class is None:
+                return cast(EventSchema, get_event_validator(source).validate_json(data))
+            return schema_class.model_validate_json(data)
+        if schema_class is None:
+            return cast(EventSchema, get_event_validator(source).validate_python(data))
         return schema_class.model_validate(data)
     except Exception as e:
         raise ValueError(f"Invalid event data for source {source}: {e}")
+
+def construct_event(data: Dict[str, Any], source: str) -> EventBase:
+    """
+    Build an event schema instance from trusted data without validation.
+
+    Only use this for data that has already been validated, such as rows
+    re-read from the database or results previously returned by
+    validate_event_data. Scraped input must go through validate_event_data.
+
+    Args:
+        data: Already-validated event data dictionary
+        source: Source identifier (e.g., 'AERC')
+
+    Returns:
+        Instance of the appropriate event schema, built with model_construct
+    """
+    return _resolve_schema(source).model_construct(**data)
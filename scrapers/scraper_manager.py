@@ -1,7 +1,8 @@
 """Scraper manager module for coordinating scraper execution."""
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Type, Optional
+from typing import Dict, List, Any, Type, Optional, NamedTuple
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,13 +12,28 @@ from .exceptions import ScraperError
 
 logger = logging.getLogger(__name__)
 
+class ScraperRunMetrics(NamedTuple):
+    """Flat per-scraper counts used to build the metrics summary."""
+    found: int = 0
+    valid: int = 0
+    added: int = 0
+    updated: int = 0
+    errored: bool = False
+
 class ScraperManager:
     """Manages scraper registration and execution."""
     
+    __slots__ = (
+        '_scrapers', '_results', '_run_metrics', '_summary_cache', 'start_time'
+    )
+    
     def __init__(self):
         """Initialize scraper manager."""
         self._scrapers: Dict[str, Type[BaseScraper]] = {}
         self._results: Dict[str, Dict[str, Any]] = {}
+        self._run_metrics: Dict[str, ScraperRunMetrics] = {}
+        # Summary computed from _run_metrics; reset whenever a run is recorded
+        self._summary_cache: Optional[Dict[str, Any]] = None
         self.start_time = datetime.now()
     
     def register_scraper(self, scraper_id: str, scraper_class: Type[BaseScraper]) -> None:
@@ -43,15 +59,24 @@ class ScraperManager:
             logger.info(f"Running scraper: {scraper_id}")
             result = await scraper.run(db)
             
+            metrics = scraper.get_metrics()
             self._results[scraper_id] = {
                 "timestamp": datetime.now().isoformat(),
-                "metrics": scraper.get_metrics(),
+                "metrics": metrics,
                 "status": result.get("status", "unknown"),
                 "events_found": result.get("events_found", 0),
                 "events_valid": result.get("events_valid", 0),
                 "events_added": result.get("events_added", 0),
                 "events_updated": result.get("events_updated", 0)
             }
+            self._run_metrics[scraper_id] = ScraperRunMetrics(
+                found=metrics.get("events_found", 0),
+                valid=metrics.get("events_valid", 0),
+                added=metrics.get("events_added", 0),
+                updated=metrics.get("events_updated", 0),
+                errored=result.get("status") == "error"
+            )
+            self._summary_cache = None
             
             return result
             
@@ -62,6 +87,8 @@ class ScraperManager:
                 "status": "error",
                 "error": str(e)
             }
+            self._run_metrics[scraper_id] = ScraperRunMetrics(errored=True)
+            self._summary_cache = None
             raise ScraperError(f"Failed to run scraper {scraper_id}: {str(e)}")
     
     async def run_all_scrapers(self, db: AsyncSession) -> Dict[str, Any]:
@@ -75,22 +102,43 @@ class ScraperManager:
             "errors": []
         }
         
-        for scraper_id in self._scrapers:
-            try:
-                result = await self.run_scraper(scraper_id, db)
-                overall_results["scrapers"][scraper_id] = result
-                if result.get("status") == "success":
-                    overall_results["total_events_found"] += result.get("events_found", 0)
-                    overall_results["total_events_added"] += result.get("events_added", 0)
-            except Exception as e:
+        # Scrapers are independent and network-bound, so run them concurrently
+        scraper_ids = list(self._scrapers)
+        results = await asyncio.gather(
+            *(self._run_in_own_session(scraper_id, db) for scraper_id in scraper_ids),
+            return_exceptions=True
+        )
+        
+        for scraper_id, result in zip(scraper_ids, results):
+            if isinstance(result, Exception):
                 overall_results["errors"].append({
                     "scraper": scraper_id,
-                    "error": str(e)
+                    "error": str(result)
                 })
+                continue
+            overall_results["scrapers"][scraper_id] = result
+            if result.get("status") == "success":
+                overall_results["total_events_found"] += result.get("events_found", 0)
+                overall_results["total_events_added"] += result.get("events_added", 0)
         
         overall_results["end_time"] = datetime.now().isoformat()
         return overall_results
     
+    async def _run_in_own_session(self, scraper_id: str, db: AsyncSession) -> Dict[str, Any]:
+        """Run a scraper in its own session on the same engine as ``db``.
+        
+        An AsyncSession cannot be shared between concurrently running tasks,
+        so each scraper gets a dedicated session that is committed on success.
+        """
+        async with AsyncSession(db.bind, expire_on_commit=False) as session:
+            try:
+                result = await self.run_scraper(scraper_id, session)
+                await session.commit()
+                return result
+            except Exception:
+                await session.rollback()
+                raise
+    
     def get_results(self, scraper_id: Optional[str] = None) -> Dict[str, Any]:
         """Get results for a specific scraper or all scrapers."""
         if scraper_id:
@@ -99,27 +147,23 @@ class ScraperManager:
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary metrics across all scrapers."""
+        if self._summary_cache is not None:
+            return self._summary_cache.copy()
+        
+        runs = self._run_metrics.values()
         summary = {
-            "total_events_found": 0,
-            "total_events_valid": 0,
-            "total_events_added": 0,
-            "total_events_updated": 0,
-            "errors": 0,
+            "total_events_found": sum(run.found for run in runs),
+            "total_events_valid": sum(run.valid for run in runs),
+            "total_events_added": sum(run.added for run in runs),
+            "total_events_updated": sum(run.updated for run in runs),
+            "errors": sum(run.errored for run in runs),
             "success_rate": 0
         }
         
-        for result in self._results.values():
-            metrics = result.get("metrics", {})
-            summary["total_events_found"] += metrics.get("events_found", 0)
-            summary["total_events_valid"] += metrics.get("events_valid", 0)
-            summary["total_events_added"] += metrics.get("events_added", 0)
-            summary["total_events_updated"] += metrics.get("events_updated", 0)
-            if result.get("status") == "error":
-                summary["errors"] += 1
-        
         if summary["total_events_found"] > 0:
             summary["success_rate"] = (
                 summary["total_events_valid"] / summary["total_events_found"]
             ) * 100
-            
-        return summary
\ No newline at end of file
+        
+        self._summary_cache = summary
+        return summary.copy()
\ No newline at end of file
@@ -4,8 +4,10 @@ Script to fetch and examine the AERC HTML structure
 """
 
 import asyncio
+import io
 import logging
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.cssselect import CSSSelector
 
 from scrapers.aerc_scraper.network import NetworkHandler
 from scrapers.aerc_scraper.config import get_settings
@@ -13,78 +15,110 @@ from scrapers.aerc_scraper.config import get_settings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("check_aerc_html")
 
+# Number of rows to examine in detail
+DETAILED_ROWS = 3
+
+# Selectors compiled once and reused for every row
+RIDE_NAME_SELECTOR = CSSSelector('span.rideName')
+RIDE_LOCATION_SELECTOR = CSSSelector('td.rideLocation')
+TITLE_SELECTOR = CSSSelector('[title]')
+
+def element_text(elem) -> str:
+    """Return the stripped text content of an element."""
+    return ''.join(elem.itertext()).strip()
+
+def element_html(elem) -> str:
+    """Serialize an element back to HTML for inspection."""
+    return etree.tostring(elem, encoding='unicode', method='html', with_tail=False)
+
+def log_row_details(index: int, row, name_elem) -> None:
+    """Log the structure of a single calendar row."""
+    logger.info(f"\n--- Row {index+1} Structure ---")
+
+    # Get ride name
+    name = element_text(name_elem) if name_elem is not None else "Unknown"
+    logger.info(f"Ride Name: {name}")
+
+    # Get ride ID if available
+    if name_elem is not None and name_elem.get('tag') is not None:
+        logger.info(f"Ride ID: {name_elem.get('tag')}")
+
+    # Check for title attributes on the row and name element
+    if row.get('title') is not None:
+        logger.info(f"Row title: {row.get('title')}")
+
+    if name_elem is not None and name_elem.get('title') is not None:
+        logger.info(f"Name elem title: {name_elem.get('title')}")
+
+    # Get location info
+    location_elems = RIDE_LOCATION_SELECTOR(row)
+    if location_elems:
+        location_elem = location_elems[0]
+        logger.info(f"Location text: '{element_text(location_elem)}'")
+        # Print the HTML of the location element to see its structure
+        logger.info(f"Location HTML: {element_html(location_elem)}")
+    else:
+        logger.info("No location element found")
+
+    # Check all elements with title attributes in the row
+    for j, elem in enumerate(TITLE_SELECTOR(row)):
+        logger.info(f"Element {j+1} with title: '{elem.get('title')}'")
+        logger.info(f"  Tag: {elem.tag}")
+        logger.info(f"  Text: '{element_text(elem)}'")
+
+    # Display the HTML of the entire row for inspection
+    logger.info(f"Full row HTML:\n{element_html(row)}")
+
 async def main():
     """Fetch and examine the AERC HTML"""
     logger.info("Fetching AERC calendar HTML")
-    
+
     # Get settings and create network handler
     settings = get_settings()
     handler = NetworkHandler(settings)
-    
+
     # Fetch the HTML
     html = await handler.fetch_calendar()
     logger.info(f"Got HTML content of size: {len(html)} bytes")
-    
-    # Parse with BeautifulSoup
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    # Find a few calendar rows to examine their structure
-    ride_rows = soup.find_all('div', class_='calendarRow')
-    logger.info(f"Found {len(ride_rows)} calendar rows")
-    
-    # Examine the first 3 rows in detail
-    for i, row in enumerate(ride_rows[:3]):
-        logger.info(f"\n--- Row {i+1} Structure ---")
-        
-        # Get ride name
-        name_elem = row.select_one('span.rideName')
-        name = name_elem.text.strip() if name_elem else "Unknown"
-        logger.info(f"Ride Name: {name}")
-        
-        # Get ride ID if available
-        ride_id = None
-        if name_elem and name_elem.has_attr('tag'):
-            ride_id = name_elem['tag']
-            logger.info(f"Ride ID: {ride_id}")
-        
-        # Check for title attributes on the row and name element
-        if row.has_attr('title'):
-            logger.info(f"Row title: {row['title']}")
-        
-        if name_elem and name_elem.has_attr('title'):
-            logger.info(f"Name elem title: {name_elem['title']}")
-        
-        # Get location info
-        location_elem = row.select_one('td.rideLocation')
-        if location_elem:
-            logger.info(f"Location text: '{location_elem.text.strip()}'")
-            # Print the HTML of the location element to see its structure
-            logger.info(f"Location HTML: {location_elem}")
-        else:
-            logger.info("No location element found")
-        
-        # Check all elements with title attributes in the row
-        title_elems = row.select('[title]')
-        for j, elem in enumerate(title_elems):
-            logger.info(f"Element {j+1} with title: '{elem['title']}'")
-            logger.info(f"  Tag: {elem.name}")
-            logger.info(f"  Text: '{elem.text.strip()}'")
-        
-        # Display the HTML of the entire row for inspection
-        logger.info(f"Full row HTML:\n{row}")
-        
+
+    # Stream the document and handle each calendar row as soon as it is
+    # complete, so the full DOM is never held in memory at once
+    total_rows = 0
+    rows_with_title = 0
+    name_elems_with_title = 0
+
+    context = etree.iterparse(
+        io.BytesIO(html.encode('utf-8')),
+        events=('end',),
+        tag='div',
+        html=True
+    )
+    for _, row in context:
+        if 'calendarRow' not in (row.get('class') or '').split():
+            continue
+
+        name_elems = RIDE_NAME_SELECTOR(row)
+        name_elem = name_elems[0] if name_elems else None
+
+        # Examine the first few rows in detail
+        if total_rows < DETAILED_ROWS:
+            log_row_details(total_rows, row, name_elem)
+
+        total_rows += 1
+        if row.get('title') is not None:
+            rows_with_title += 1
+        if name_elem is not None and name_elem.get('title') is not None:
+            name_elems_with_title += 1
+
+        # Release the processed row and everything parsed before it
+        row.clear()
+        while row.getprevious() is not None:
+            del row.getparent()[0]
+
     # Print a summary
-    logger.info(f"\nTotal rows: {len(ride_rows)}")
-    
-    # Count how many rows have title attributes
-    rows_with_title = sum(1 for row in ride_rows if row.has_attr('title'))
+    logger.info(f"\nTotal rows: {total_rows}")
     logger.info(f"Rows with title attribute: {rows_with_title}")
-    
-    # Count how many ride name elements have title attributes
-    name_elems_with_title = sum(1 for row in ride_rows 
-                              if row.select_one('span.rideName') and 
-                              row.select_one('span.rideName').has_attr('title'))
     logger.info(f"Ride name elements with title attribute: {name_elems_with_title}")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main())
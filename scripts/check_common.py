@@ -0,0 +1,38 @@
+"""
+Helpers shared by the check_*.py database inspection scripts.
+"""
+from typing import Any
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def make_check_engine(database_url: str) -> AsyncEngine:
+    """
+    Create the engine used by a check script.
+
+    The scripts run a handful of small queries one after another, so a
+    single pooled connection serves them all. Callers dispose of the engine
+    when done.
+
+    Args:
+        database_url: Async SQLAlchemy database URL
+
+    Returns:
+        AsyncEngine holding at most one connection
+    """
+    return create_async_engine(
+        database_url,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
+        # JIT compilation only adds startup cost to these small queries
+        connect_args={'server_settings': {'jit': 'off'}},
+        # Decode JSONB columns with orjson in asyncpg's codec
+        json_deserializer=orjson.loads,
+    )
+
+def format_json(value: Any) -> str:
+    """Pretty-print a JSON value for display."""
+    return orjson.dumps(value, option=JSON_OPTIONS, default=str).decode()
@@ -2,12 +2,16 @@ import asyncio
 import sys
 import logging
 import os
-from sqlalchemy.ext.asyncio import create_async_engine
+import time
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy import text
 
+from scripts.check_common import make_check_engine
+
 # Configuration
-MAX_RETRIES = 5
-RETRY_DELAY = 3  # seconds
+CONNECT_DEADLINE = 15  # seconds to keep retrying before giving up
+INITIAL_RETRY_DELAY = 0.1  # seconds, doubled after each failed attempt
+MAX_RETRY_DELAY = 3  # seconds
 
 def get_database_url() -> str:
     """Get the appropriate database URL based on environment."""
@@ -21,11 +25,23 @@ async def test_database_connection() -> bool:
     database_url = get_database_url()
     print(f"Testing database connection to {database_url}...")
     
-    engine = create_async_engine(database_url)
+    engine = make_check_engine(database_url)
+    
+    try:
+        return await _check_connection(engine, database_url)
+    finally:
+        await engine.dispose()
+
+async def _check_connection(engine: AsyncEngine, database_url: str) -> bool:
+    """Run the connection test query, retrying with exponential backoff until the deadline."""
+    deadline = time.monotonic() + CONNECT_DEADLINE
+    delay = INITIAL_RETRY_DELAY
+    attempt = 0
     
-    for attempt in range(MAX_RETRIES):
+    while True:
+        attempt += 1
         try:
-            print(f"Connection attempt {attempt+1}/{MAX_RETRIES}...")
+            print(f"Connection attempt {attempt}...")
             async with engine.connect() as conn:
                 # Test simple query
                 result = await conn.execute(text("SELECT 1 as test"))
@@ -37,19 +53,23 @@ async def test_database_connection() -> bool:
                     return True
                 else:
                     print("❌ Connection succeeded but test query failed.")
+                    return False
         except Exception as e:
-            print(f"❌ Connection attempt {attempt+1} failed: {str(e)}")
-            if attempt < MAX_RETRIES - 1:
-                print(f"Retrying in {RETRY_DELAY} seconds...")
-                await asyncio.sleep(RETRY_DELAY)
-            else:
-                print("\nTROUBLESHOOTING TIPS:")
-                print("1. Check if DATABASE_URL environment variable is set correctly")
-                print("   Current value:", database_url)
-                print("2. If using Docker, ensure you're using the service name 'db'")
-                print("   Example: postgresql+asyncpg://postgres:postgres@db/trailblaze")
-                print("3. If running locally, make sure PostgreSQL is running on port 5432")
+            print(f"❌ Connection attempt {attempt} failed: {str(e)}")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait = min(delay, remaining)
+            print(f"Retrying in {wait:.1f} seconds...")
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, MAX_RETRY_DELAY)
     
+    print("\nTROUBLESHOOTING TIPS:")
+    print("1. Check if DATABASE_URL environment variable is set correctly")
+    print("   Current value:", database_url)
+    print("2. If using Docker, ensure you're using the service name 'db'")
+    print("   Example: postgresql+asyncpg://postgres:postgres@db/trailblaze")
+    print("3. If running locally, make sure PostgreSQL is running on port 5432")
     return False
 
 async def main():
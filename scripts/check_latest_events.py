@@ -3,10 +3,12 @@
 Script to check the latest events in the database.
 """
 import asyncio
+import io
+import sys
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-import json
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from scripts.check_common import format_json, make_check_engine
 
 async def main():
     """Check latest events in production database."""
@@ -14,51 +16,64 @@ async def main():
     database_url = "postgresql+asyncpg://postgres:postgres@db/trailblaze"
     
     # Create engine and session
-    engine = create_async_engine(database_url)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    engine = make_check_engine(database_url)
+    async_session = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     
-    async with async_session() as session:
-        # Check connection
-        from sqlalchemy import text
-        result = await session.execute(text("SELECT 1 as test"))
-        row = result.first()
-        print(f"Database connection test: {row.test if row else 'Failed'}")
+    try:
+        async with async_session() as session:
+            # Check connection
+            from sqlalchemy import text
+            result = await session.execute(text("SELECT 1 as test"))
+            row = result.first()
+            print(f"Database connection test: {row.test if row else 'Failed'}")
         
-        # Get the Event model
-        from app.models.event import Event
+            # Get the Event model
+            from app.models.event import Event
         
-        # Get the latest 10 events
-        query = select(Event).order_by(Event.created_at.desc()).limit(10)
-        result = await session.execute(query)
-        events = result.scalars().all()
+            # Get the latest 10 events
+            # Select just the displayed columns; rows are read-only tuples that
+            # bypass the ORM identity map
+            query = select(
+                Event.id, Event.name, Event.location, Event.date_start,
+                Event.region, Event.event_details, Event.has_intro_ride, Event.ride_id
+            ).order_by(Event.created_at.desc()).limit(10)
+            result = await session.execute(query)
+            events = result.all()
         
-        # Display event information
-        for i, event in enumerate(events):
-            print(f"\nEvent {i+1}:")
-            print(f"ID: {event.id}")
-            print(f"Name: {event.name}")
-            print(f"Location: {event.location}")
-            print(f"Date: {event.date_start}")
-            print(f"Region: {event.region}")
+            # Display event information, collected in memory and written out in one go
+            out = io.StringIO()
+            for i, event in enumerate(events):
+                print(f"\nEvent {i+1}:", file=out)
+                print(f"ID: {event.id}", file=out)
+                print(f"Name: {event.name}", file=out)
+                print(f"Location: {event.location}", file=out)
+                print(f"Date: {event.date_start}", file=out)
+                print(f"Region: {event.region}", file=out)
             
-            # Check location details in event_details
-            location_details = event.event_details.get('location_details') if event.event_details else None
-            print(f"Location details: {json.dumps(location_details, indent=2, default=str) if location_details else 'None'}")
+                # Check location details in event_details
+                location_details = event.event_details.get('location_details') if event.event_details else None
+                print(f"Location details: {format_json(location_details) if location_details else 'None'}", file=out)
             
-            # Check has_intro_ride
-            has_intro_ride = event.has_intro_ride
-            has_intro_ride_in_details = event.event_details.get('has_intro_ride') if event.event_details else None
-            print(f"has_intro_ride (field): {has_intro_ride}")
-            print(f"has_intro_ride (details): {has_intro_ride_in_details}")
+                # Check has_intro_ride
+                has_intro_ride = event.has_intro_ride
+                has_intro_ride_in_details = event.event_details.get('has_intro_ride') if event.event_details else None
+                print(f"has_intro_ride (field): {has_intro_ride}", file=out)
+                print(f"has_intro_ride (details): {has_intro_ride_in_details}", file=out)
             
-            # Check is_multi_day_event and is_pioneer_ride
-            is_multi_day = event.event_details.get('is_multi_day_event') if event.event_details else None
-            is_pioneer = event.event_details.get('is_pioneer_ride') if event.event_details else None
-            print(f"is_multi_day_event: {is_multi_day}")
-            print(f"is_pioneer_ride: {is_pioneer}")
+                # Check is_multi_day_event and is_pioneer_ride
+                is_multi_day = event.event_details.get('is_multi_day_event') if event.event_details else None
+                is_pioneer = event.event_details.get('is_pioneer_ride') if event.event_details else None
+                print(f"is_multi_day_event: {is_multi_day}", file=out)
+                print(f"is_pioneer_ride: {is_pioneer}", file=out)
             
-            print(f"ride_id: {event.ride_id}")
-            print("-" * 50)
+                print(f"ride_id: {event.ride_id}", file=out)
+                print("-" * 50, file=out)
+        
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
+    finally:
+        await engine.dispose()
+
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main()) 
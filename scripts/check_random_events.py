@@ -3,59 +3,81 @@
 Script to check random events in the database.
 """
 import asyncio
-import json
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+import io
+import sys
+from sqlalchemy import select, func, tablesample
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from scripts.check_common import format_json, make_check_engine
 
 async def check_events():
     # Define database URL
     database_url = "postgresql+asyncpg://postgres:postgres@db/trailblaze"
     
     # Create engine and session
-    engine = create_async_engine(database_url)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    engine = make_check_engine(database_url)
+    async_session = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     
-    async with async_session() as session:
-        # Get the Event model
-        from app.models.event import Event
+    try:
+        async with async_session() as session:
+            # Get the Event model
+            from app.models.event import Event
         
-        # Get 10 random events with all their data
-        query = select(Event).order_by(func.random()).limit(10)
-        result = await session.execute(query)
-        events = result.scalars().all()
+            # Get 10 random events. TABLESAMPLE SYSTEM_ROWS reads a random set of
+            # pages instead of sorting the whole table by random() (needs the
+            # tsm_system_rows extension, created by migration)
+            sampled = aliased(Event, tablesample(Event.__table__, func.system_rows(10), name='sampled_events'))
+            
+            # Select just the displayed columns; rows are read-only tuples that
+            # bypass the ORM identity map
+            query = select(
+                sampled.id, sampled.name, sampled.ride_id, sampled.distances, sampled.ride_manager,
+                sampled.location, sampled.date_start, sampled.date_end, sampled.event_details,
+                sampled.description, sampled.directions, sampled.judges
+            )
+            # Stream rows instead of materializing the whole result first
+            result = await session.stream(query.execution_options(yield_per=25))
         
-        for event in events:
-            print(f'\nEvent ID: {event.id}')
-            print(f'Name: {event.name}')
-            print(f'Ride ID: {event.ride_id}')
-            print(f'Distances: {event.distances}')
-            print(f'Ride Manager: {event.ride_manager}')
-            print(f'Location: {event.location}')
-            print(f'Date: {event.date_start} to {event.date_end}')
+            # Collect the report in memory and write it out in one go
+            out = io.StringIO()
+            async for event in result:
+                print(f'\nEvent ID: {event.id}', file=out)
+                print(f'Name: {event.name}', file=out)
+                print(f'Ride ID: {event.ride_id}', file=out)
+                print(f'Distances: {event.distances}', file=out)
+                print(f'Ride Manager: {event.ride_manager}', file=out)
+                print(f'Location: {event.location}', file=out)
+                print(f'Date: {event.date_start} to {event.date_end}', file=out)
             
-            # Access event_details JSON field
-            event_details = event.event_details or {}
-            is_multi_day = event_details.get('is_multi_day_event', False)
-            is_pioneer = event_details.get('is_pioneer_ride', False)
-            ride_days = event_details.get('ride_days', 1)
+                # Access event_details JSON field
+                event_details = event.event_details or {}
+                is_multi_day = event_details.get('is_multi_day_event', False)
+                is_pioneer = event_details.get('is_pioneer_ride', False)
+                ride_days = event_details.get('ride_days', 1)
             
-            print(f'Multi-day: {is_multi_day}')
-            print(f'Pioneer: {is_pioneer}')
-            print(f'Ride Days: {ride_days}')
+                print(f'Multi-day: {is_multi_day}', file=out)
+                print(f'Pioneer: {is_pioneer}', file=out)
+                print(f'Ride Days: {ride_days}', file=out)
             
-            print(f'Description: {event.description[:100]}...' if event.description and len(event.description) > 100 else event.description)
-            print(f'Directions: {event.directions[:100]}...' if event.directions and len(event.directions) > 100 else event.directions)
-            print(f'Judges: {event.judges}')
+                print(f'Description: {event.description[:100]}...' if event.description and len(event.description) > 100 else event.description, file=out)
+                print(f'Directions: {event.directions[:100]}...' if event.directions and len(event.directions) > 100 else event.directions, file=out)
+                print(f'Judges: {event.judges}', file=out)
             
-            # Get contact info from event_details
-            contact_info = event_details.get('ride_manager_contact', {})
-            print(f'Contact Info: {json.dumps(contact_info, indent=2, default=str)}')
+                # Get contact info from event_details
+                contact_info = event_details.get('ride_manager_contact', {})
+                print(f'Contact Info: {format_json(contact_info)}', file=out)
             
-            # Check for structured distances in event_details
-            structured_distances = event_details.get('distances', [])
-            if structured_distances:
-                print(f'Structured Distances: {json.dumps(structured_distances, indent=2, default=str)}')
+                # Check for structured distances in event_details
+                structured_distances = event_details.get('distances', [])
+                if structured_distances:
+                    print(f'Structured Distances: {format_json(structured_distances)}', file=out)
+        
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
+    finally:
+        await engine.dispose()
+
 
 if __name__ == "__main__":
-    asyncio.run(check_events()) 
\ No newline at end of file
+    asyncio.run(check_events()) 
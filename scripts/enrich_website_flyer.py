@@ -11,17 +11,21 @@ Usage:
 
 import asyncio
 import logging
+import os
 import sys
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 import sqlalchemy as sa
 from sqlalchemy.future import select
+from sqlalchemy.orm import load_only
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import async_session
 from app.models import Event
 from app.services.enrichment import WebsiteFlyerEnrichmentService
+from app.services.enrichment.website_flyer import LAST_WEBSITE_CHECK_KEY
 
 # Configure logging
 logging.basicConfig(
@@ -31,68 +35,86 @@ logging.basicConfig(
 )
 logger = logging.getLogger("enrich_website_flyer")
 
-async def get_events_needing_enrichment(session: AsyncSession, batch_size: int = 50, limit: Optional[int] = None) -> List[Event]:
+# Maximum number of events enriched at once, bounding outbound fetch/AI calls
+ENRICH_CONCURRENCY = int(os.getenv('ENRICH_CONCURRENCY', '8'))
+
+async def get_events_needing_enrichment(session: AsyncSession, batch_size: int = 50,
+                                        after: Optional[Tuple[datetime, int]] = None) -> List[Event]:
     """
-    Get events that need website/flyer enrichment.
+    Get the next page of events that need website/flyer enrichment.
     
     Args:
         session: Database session
         batch_size: Number of events to fetch
-        limit: Optional limit on total number of events to process
+        after: (date_start, id) of the last event on the previous page, or
+            None for the first page
         
     Returns:
-        List of Event objects needing enrichment
+        List of Event objects needing enrichment, in (date_start, id) order
     """
     now = datetime.now()
-    three_months_from_now = now.date() + timedelta(days=90)
+    three_months_from_now = now + timedelta(days=90)
     one_day_ago = now - timedelta(days=1)
     seven_days_ago = now - timedelta(days=7)
     
+    # When the website was last checked; kept in event_details as there is
+    # no column for it
+    last_checked = sa.cast(Event.event_details[LAST_WEBSITE_CHECK_KEY].astext, sa.DateTime)
+    
     # Tiered query based on date proximity and last check time
     # Query structure:
-    # 1. Events with website_url but no event_details or never checked
+    # 1. Events with a website but no event_details or never checked
     # 2. Near-term events (within 3 months) not checked in the last day
     # 3. Future events (beyond 3 months) not checked in the last week
+    # Filtering on website and date_start lets the partial
+    # idx_events_needs_enrichment index serve the scan.
     query = (
         select(Event)
+        # Only the fields the enrichment service reads; description, directions
+        # and the other text columns are never touched here
+        .options(load_only(
+            Event.id, Event.name, Event.location, Event.website,
+            Event.date_start, Event.event_details
+        ))
         .where(
-            # Must have a website URL to enrich
-            Event.website_url.is_not(None),
+            # Must have a website to enrich
+            Event.website.is_not(None),
             
             # And match one of these conditions
             sa.or_(
                 # No event_details or empty event_details
                 sa.or_(
                     Event.event_details.is_(None),
-                    Event.event_details == sa.cast({}, sa.JSON)
+                    Event.event_details == sa.cast({}, JSONB)
                 ),
                 
                 # Never checked
-                Event.last_website_check_at.is_(None),
+                last_checked.is_(None),
                 
                 # Near-term events (within 3 months) not checked in the last day
                 sa.and_(
-                    Event.date <= three_months_from_now,
-                    sa.or_(
-                        Event.last_website_check_at.is_(None),
-                        Event.last_website_check_at < one_day_ago
-                    )
+                    Event.date_start <= three_months_from_now,
+                    last_checked < one_day_ago
                 ),
                 
                 # Future events (beyond 3 months) not checked in the last week
                 sa.and_(
-                    Event.date > three_months_from_now,
-                    sa.or_(
-                        Event.last_website_check_at.is_(None),
-                        Event.last_website_check_at < seven_days_ago
-                    )
+                    Event.date_start > three_months_from_now,
+                    last_checked < seven_days_ago
                 )
             )
         )
-        .order_by(Event.date)
-        .limit(limit if limit is not None else batch_size)
+        .order_by(Event.date_start, Event.id)
+        .limit(batch_size)
     )
     
+    # Keyset pagination: resume after the previous page's last row. Events
+    # enriched (or skipped) earlier can't shift later pages the way OFFSET
+    # would, and each page is a short query that doesn't hold a cursor open
+    # across the commits in between.
+    if after is not None:
+        query = query.where(sa.tuple_(Event.date_start, Event.id) > sa.tuple_(*after))
+    
     result = await session.execute(query)
     return list(result.scalars().all())
     
@@ -110,56 +132,55 @@ async def enrich_website_flyer(batch_size: int = 50, limit: Optional[int] = None
     service = WebsiteFlyerEnrichmentService()
     total_processed = 0
     total_enriched = 0
+    semaphore = asyncio.Semaphore(ENRICH_CONCURRENCY)
+    
+    async def enrich_one(event: Event) -> bool:
+        """Enrich a single event once a concurrency slot is free."""
+        async with semaphore:
+            return await service.enrich_event(event)
     
     try:
         async with async_session() as session:
-            # Get total count of events with website URLs
-            query = select(sa.func.count()).select_from(Event).where(
-                Event.website_url.is_not(None)
-            )
-            result = await session.execute(query)
-            total_events_with_url = result.scalar_one()
-            
-            if total_events_with_url == 0:
-                logger.info("No events found with website URLs.")
-                return {
-                    "total_processed": 0,
-                    "total_enriched": 0,
-                    "success_rate": 0
-                }
-            
-            logger.info(f"Found {total_events_with_url} events with website URLs.")
+            # No up-front COUNT: the loop stops on the first short page
+            remaining = limit
+            after = None
             
-            # Apply limit if specified
-            remaining = limit if limit is not None else total_events_with_url
-            
-            while remaining > 0:
-                current_batch_size = min(batch_size, remaining)
-                
-                # Get events needing enrichment
-                events = await get_events_needing_enrichment(session, current_batch_size)
+            while remaining is None or remaining > 0:
+                current_batch_size = batch_size if remaining is None else min(batch_size, remaining)
                 
+                events = await get_events_needing_enrichment(session, current_batch_size, after)
                 if not events:
                     logger.info("No more events found that need enrichment.")
                     break
-                    
-                logger.info(f"Processing batch of {len(events)} events")
+                after = (events[-1].date_start, events[-1].id)
                 
-                # Process each event in the batch
-                for event in events:
-                    success = await service.enrich_event(event)
-                    total_processed += 1
-                    
-                    if success:
+                # Enrich the page concurrently; the semaphore caps how many
+                # fetch/AI calls are in flight at once. The service only
+                # mutates the events, so the batch is committed once below.
+                results = await asyncio.gather(
+                    *(enrich_one(event) for event in events),
+                    return_exceptions=True
+                )
+                batch_count = len(results)
+                total_processed += batch_count
+                
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Error enriching event: {result}")
+                    elif result:
                         total_enriched += 1
                 
                 # Commit the batch
                 await session.commit()
-                logger.info(f"Committed batch of {len(events)} events")
+                logger.info(f"Committed batch of {batch_count} events")
                 
                 # Update remaining count
-                if limit is not None:
-                    remaining -= len(events)
+                if remaining is not None:
+                    remaining -= batch_count
+                
+                # A short page means there are no candidates left
+                if batch_count < current_batch_size:
+                    break
                     
         # Close aiohttp session
         await service.close()
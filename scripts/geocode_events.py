@@ -17,6 +17,9 @@ Usage:
     
     # Use simplified geocoding approach
     docker-compose run --rm api python -m scripts.geocode_events --simple
+
+Simple mode results are cached on disk (GEOCODE_CACHE_PATH, default
+cache/geocode.sqlite3) so repeat runs skip addresses already looked up.
 """
 
 import asyncio
@@ -24,16 +27,18 @@ import argparse
 import logging
 import sys
 import re
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import sqlalchemy as sa
 from sqlalchemy.future import select
+from sqlalchemy.orm import load_only
 from sqlalchemy.ext.asyncio import AsyncSession
 import aiohttp
 
 from app.database import async_session
 from app.models import Event
 from app.services.enrichment import GeocodingEnrichmentService
+from app.services.geocoding import GeocodeCache, RequestThrottle
 
 # Configure logging
 logging.basicConfig(
@@ -43,106 +48,196 @@ logging.basicConfig(
 )
 logger = logging.getLogger("geocode_events")
 
-async def geocode_address_simple(address: str) -> Optional[Tuple[float, float]]:
+NOMINATIM_URL = 'https://nominatim.openstreetmap.org/search'
+NOMINATIM_HEADERS = {'User-Agent': 'TrailBlazeApp/1.0'}
+
+# Connection pool settings for the shared HTTP session: keep connections
+# alive and cache DNS so repeat requests skip the TCP/TLS handshake
+HTTP_CONNECTION_LIMIT = 8
+HTTP_DNS_CACHE_TTL = 600
+HTTP_KEEPALIVE_TIMEOUT = 30
+HTTP_TIMEOUT_SECONDS = 10
+
+# Address parsing patterns, compiled once for every event in the run
+WHITESPACE_PATTERN = re.compile(r'\s+')
+PARENTHESES_PATTERN = re.compile(r'\([^)]*\)')
+ADDRESS_HINT_PATTERN = re.compile(
+    r'\d+|\brd\b|\bst\b|\bave\b|\bhwy\b|\broute\b|\bcounty\b|\bpark\b',
+    re.IGNORECASE
+)
+# City followed by a common US state abbreviation
+CITY_STATE_PATTERN = re.compile(
+    r'([A-Za-z\s]+),?\s+'
+    r'(AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)'
+)
+LOCATION_NAME_PATTERN = re.compile(r'([A-Za-z\s]{3,})')
+LANDMARK_PATTERN = re.compile(
+    r'([A-Za-z\s]{3,}(?:Park|Forest|Mountain|Trail|Ranch))',
+    re.IGNORECASE
+)
+
+# Generic address words that make poor standalone geocoding queries
+LOCATION_STOPWORDS = frozenset({
+    'road', 'street', 'avenue', 'drive', 'lane', 'blvd', 'highway',
+    'north', 'south', 'east', 'west', 'limited', 'entries', 'ride',
+    'intro', 'each', 'day'
+})
+
+# A normalized address paired with the Nominatim queries to try for it
+AddressQueries = Tuple[str, List[Dict[str, str]]]
+
+def build_address_queries(address: str) -> AddressQueries:
     """
-    Simplified geocoding function using OpenStreetMap Nominatim API directly.
+    Normalize an address and build the Nominatim queries to try for it.
     
     Args:
-        address: The address to geocode
+        address: The raw address to parse
         
     Returns:
-        Tuple of (latitude, longitude) or None if geocoding failed
+        Tuple of (normalized address, queries ordered most precise first).
+        The normalized address is also the cache key. Empty input yields
+        no queries.
     """
     if not address:
-        logger.warning("Empty address provided for geocoding")
-        return None
-        
+        return '', []
+    
     # Clean up the address
-    address = re.sub(r'\s+', ' ', address).strip()
+    address = WHITESPACE_PATTERN.sub(' ', address).strip()
     
     # Remove anything in parentheses
-    address = re.sub(r'\([^)]*\)', '', address)
+    address = PARENTHESES_PATTERN.sub('', address)
     
     # Extract the most likely address part if there's a dash or comma
     if " - " in address:
         parts = address.split(" - ")
         for part in parts:
-            if re.search(r'\d+|\brd\b|\bst\b|\bave\b|\bhwy\b|\broute\b|\bcounty\b|\bpark\b', part, re.IGNORECASE):
+            if ADDRESS_HINT_PATTERN.search(part):
                 address = part.strip()
                 break
     
-    logger.info(f"Simple geocoding address: {address}")
-    
-    # Extract city and state information
-    # Common US state abbreviations pattern
-    us_state_pattern = r'(AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)'
+    # Queries to try, most precise first. Each is a dict of Nominatim search
+    # parameters: structured (street/city/state) when the address has a
+    # recognisable city and state, freeform (q) otherwise.
+    queries: List[Dict[str, str]] = []
     
     # Try to find city and state information
-    city_state_match = re.search(r'([A-Za-z\s]+),?\s+' + us_state_pattern, address)
-    
-    # Create different address variations to try
-    address_variations = [address]
-    
-    # Add city, state variation if found
+    city_state_match = CITY_STATE_PATTERN.search(address)
     if city_state_match:
         city = city_state_match.group(1).strip()
         state = city_state_match.group(2)
-        city_state = f"{city}, {state}, USA"
-        address_variations.append(city_state)
+        street = address[:city_state_match.start()].strip(' ,')
+        structured = {'city': city, 'state': state, 'country': 'USA'}
         
-        # Also add just the city name
-        if city:
-            address_variations.append(f"{city}, USA")
+        if street:
+            queries.append({'street': street, **structured})
+        queries.append({'q': address})
+        
+        # One structured city/state query replaces the separate
+        # "city, state" and "city" freeform variations
+        queries.append(structured)
+    else:
+        queries.append({'q': address})
     
     # Extract just location names (non-numeric parts) as fallback
-    location_names = re.findall(r'([A-Za-z\s]{3,})', address)
+    location_names = LOCATION_NAME_PATTERN.findall(address)
     for name in location_names:
         name = name.strip()
-        if name and len(name) > 3 and name.lower() not in ['road', 'street', 'avenue', 'drive', 'lane', 'blvd', 'highway', 'north', 'south', 'east', 'west', 'limited', 'entries', 'ride', 'intro', 'each', 'day']:
-            address_variations.append(name)
+        if len(name) > 3 and name.lower() not in LOCATION_STOPWORDS:
+            queries.append({'q': name})
     
     # Add the specific locations by name if we can identify them
     if any(park in address.lower() for park in ['park', 'forest', 'mountain', 'trail', 'ranch']):
-        park_names = re.findall(r'([A-Za-z\s]{3,}(?:Park|Forest|Mountain|Trail|Ranch))', address, re.IGNORECASE)
+        park_names = LANDMARK_PATTERN.findall(address)
         for park in park_names:
-            address_variations.append(park.strip())
+            queries.append({'q': park.strip()})
+    
+    # Drop repeated queries (e.g. a bare place name matching the address)
+    # so no variation costs a second request
+    unique = dict.fromkeys(tuple(query.items()) for query in queries)
+    return address, [dict(query) for query in unique]
+
+def build_batch_queries(locations: List[str]) -> List[AddressQueries]:
+    """
+    Parse every address in a batch in one pass before any request is sent.
+    
+    This keeps the regex work out of the concurrent HTTP stage, where it
+    would otherwise interleave with every task's network waits.
+    """
+    build = build_address_queries
+    return [build(location) for location in locations]
+
+async def geocode_queries(
+    address: str,
+    queries: List[Dict[str, str]],
+    session: aiohttp.ClientSession,
+    throttle: RequestThrottle,
+    cache: Optional[GeocodeCache] = None
+) -> Optional[Tuple[float, float]]:
+    """
+    Send prepared Nominatim queries for an address until one matches.
+    
+    Args:
+        address: The normalized address, used for logging and as the cache key
+        queries: Queries from build_address_queries, most precise first
+        session: Shared HTTP session for Nominatim requests
+        throttle: Shared throttle keeping requests within Nominatim's rate limit
+        cache: Optional persistent cache consulted before any request is made
+        
+    Returns:
+        Tuple of (latitude, longitude) or None if geocoding failed
+    """
+    if not address:
+        logger.warning("Empty address provided for geocoding")
+        return None
+    
+    logger.info(f"Simple geocoding address: {address}")
+    
+    if cache is not None:
+        hit, coordinates = cache.lookup(address)
+        if hit:
+            logger.info(f"Using cached geocoding result for: {address}")
+            return coordinates
     
-    # Try each address variation
-    for i, addr_var in enumerate(address_variations):
+    # Try each query; Nominatim deduplicates results so the first is the best match
+    had_error = False
+    for i, query in enumerate(queries):
+        query_text = query.get('q') or ', '.join(query.values())
         if i > 0:
-            logger.info(f"Trying address variation {i}: {addr_var}")
+            logger.info(f"Trying address variation {i}: {query_text}")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    'q': addr_var,
-                    'format': 'json',
-                    'limit': 1,
-                    'addressdetails': 1
-                }
-                headers = {
-                    'User-Agent': 'TrailBlazeApp/1.0'
-                }
-                async with session.get('https://nominatim.openstreetmap.org/search', params=params, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data and isinstance(data, list) and len(data) > 0:
-                            lat = float(data[0]['lat'])
-                            lon = float(data[0]['lon'])
-                            logger.info(f"Successfully geocoded '{addr_var}' to: {lat}, {lon}")
-                            return (lat, lon)
-                        else:
-                            logger.warning(f"No results found for address variation: {addr_var}")
+            params = {
+                **query,
+                'format': 'jsonv2',
+                'limit': 1,
+                'dedupe': 1,
+                'addressdetails': 1
+            }
+            await throttle.wait()
+            async with session.get(NOMINATIM_URL, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data and isinstance(data, list) and len(data) > 0:
+                        lat = float(data[0]['lat'])
+                        lon = float(data[0]['lon'])
+                        logger.info(f"Successfully geocoded '{query_text}' to: {lat}, {lon}")
+                        if cache is not None:
+                            cache.store(address, (lat, lon))
+                        return (lat, lon)
                     else:
-                        logger.error(f"Error geocoding address, status code: {response.status}")
-                
-                # Add a small delay to avoid rate limiting
-                await asyncio.sleep(0.5)
+                        logger.warning(f"No results found for address variation: {query_text}")
+                else:
+                    had_error = True
+                    logger.error(f"Error geocoding address, status code: {response.status}")
                 
         except Exception as e:
+            had_error = True
             logger.exception(f"Exception during simple geocoding: {str(e)}")
     
-    # If we're here, all geocoding attempts failed
+    # If we're here, all geocoding attempts failed. Only remember the miss
+    # when Nominatim actually answered, not when a request errored.
+    if cache is not None and not had_error:
+        cache.store(address, None)
     return None
 
 async def geocode_events(batch_size: int = 50, limit: Optional[int] = 3, simple_mode: bool = False) -> None:
@@ -158,77 +253,116 @@ async def geocode_events(batch_size: int = 50, limit: Optional[int] = 3, simple_
     total_processed = 0
     total_geocoded = 0
     
+    # Every outbound request, including the service's fallback queries and
+    # retries, waits on the same throttle to stay within Nominatim's 1 rps
+    throttle = RequestThrottle()
+    
     # Only create the service if we're not in simple mode
-    service = None if simple_mode else GeocodingEnrichmentService()
+    service = None if simple_mode else GeocodingEnrichmentService(throttle)
+    cache = GeocodeCache() if simple_mode else None
     
-    async with async_session() as session:
-        # Get total count of events without coordinates
-        query = select(sa.func.count()).select_from(Event).where(
-            (Event.latitude.is_(None)) | (Event.longitude.is_(None))
-        )
-        result = await session.execute(query)
-        total_events = result.scalar_one()
+    async def geocode_one(
+        event: Event,
+        prepared: Optional[AddressQueries],
+        http: aiohttp.ClientSession
+    ) -> Optional[Tuple[float, float]]:
+        """Geocode a single event's location."""
+        if not event.location:
+            return None
         
-        if total_events == 0:
-            logger.info("No events found that need geocoding.")
-            return
+        if simple_mode:
+            # Use the simple geocoding method with the batch's pre-parsed queries
+            address, queries = prepared
+            return await geocode_queries(address, queries, http, throttle, cache)
         
-        logger.info(f"Found {total_events} events without coordinates.")
-        
-        # Apply limit if specified
-        if limit is not None:
-            total_events = min(total_events, limit)
-            logger.info(f"Will process up to {total_events} events due to limit.")
-        
-        # Process events in batches
-        offset = 0
-        while offset < total_events:
-            # Determine batch size
-            current_batch_size = min(batch_size, total_events - offset)
+        # Use the full enrichment service, which sets the coordinates on the
+        # instance itself; they are flushed when the batch is committed
+        if await service.enrich_event(event):
+            return event.latitude, event.longitude
+        return None
+    
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+    )
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS)
+    
+    try:
+        async with async_session() as session, \
+                aiohttp.ClientSession(connector=connector, headers=NOMINATIM_HEADERS, timeout=timeout) as http:
+            # Walk the candidates in primary key order. Keyset pagination keeps each
+            # batch an index seek, and rows geocoded (or skipped) in earlier batches
+            # cannot shift later pages the way OFFSET would
+            last_id = 0
+            while limit is None or total_processed < limit:
+                # Determine batch size
+                current_batch_size = batch_size if limit is None else min(batch_size, limit - total_processed)
             
-            # Query events without coordinates
-            query = select(Event).where(
-                (Event.latitude.is_(None)) | (Event.longitude.is_(None))
-            ).offset(offset).limit(current_batch_size)
+                # Query events without coordinates, loading only the columns
+                # geocoding reads so wide JSON/text columns stay in the database
+                query = select(Event).options(
+                    load_only(Event.id, Event.name, Event.location, Event.latitude, Event.longitude)
+                ).where(
+                    sa.or_(Event.latitude.is_(None), Event.longitude.is_(None)),
+                    Event.id > last_id
+                ).order_by(Event.id).limit(current_batch_size)
             
-            result = await session.execute(query)
-            events = result.scalars().all()
+                result = await session.execute(query)
+                events = result.scalars().all()
             
-            if not events:
-                break
+                if not events:
+                    if total_processed == 0:
+                        logger.info("No events found that need geocoding.")
+                    break
                 
-            logger.info(f"Processing batch of {len(events)} events (offset: {offset})")
+                last_id = events[-1].id
+                logger.info(f"Processing batch of {len(events)} events (ids {events[0].id}-{last_id})")
             
-            # Process each event in the batch
-            for i, event in enumerate(events):
-                logger.info(f"Geocoding event {i+1}/{len(events)}: {event.name} - {event.location}")
-                
-                success = False
+                # Parse all of the batch's addresses before dispatching requests
                 if simple_mode:
-                    # Use the simple geocoding method
-                    if event.location:
-                        coordinates = await geocode_address_simple(event.location)
-                        if coordinates:
-                            event.latitude, event.longitude = coordinates
-                            success = True
+                    prepared = build_batch_queries([event.location or '' for event in events])
                 else:
-                    # Use the full geocoding service
-                    success = await service.enrich_event(event)
-                
-                total_processed += 1
+                    prepared = [None] * len(events)
+            
+                # Geocode the batch concurrently; outbound requests share one
+                # HTTP session and are spaced by the throttle
+                results = await asyncio.gather(
+                    *(geocode_one(event, queries, http) for event, queries in zip(events, prepared)),
+                    return_exceptions=True
+                )
+            
+                updates: List[Dict[str, float]] = []
+                for event, coordinates in zip(events, results):
+                    total_processed += 1
                 
-                if success:
-                    total_geocoded += 1
-                    logger.info(f"Successfully geocoded: {event.name} - ({event.latitude}, {event.longitude})")
-                else:
-                    logger.warning(f"Failed to geocode: {event.name} - {event.location}")
+                    if isinstance(coordinates, Exception):
+                        logger.error(f"Error geocoding {event.name}: {coordinates}")
+                    elif coordinates:
+                        total_geocoded += 1
+                        latitude, longitude = coordinates
+                        if simple_mode:
+                            updates.append({'id': event.id, 'latitude': latitude, 'longitude': longitude})
+                        logger.info(f"Successfully geocoded: {event.name} - ({latitude}, {longitude})")
+                    else:
+                        logger.warning(f"Failed to geocode: {event.name} - {event.location}")
             
-            # Commit the batch
-            await session.commit()
-            logger.info(f"Committed batch of {len(events)} events")
+                # Write simple-mode coordinates as one executemany UPDATE by
+                # primary key rather than flushing each instance separately;
+                # instances updated by the enrichment service flush on commit
+                if updates:
+                    await session.execute(sa.update(Event), updates)
+                await session.commit()
+                logger.info(f"Committed batch of {len(events)} events")
             
-            # Update offset for next batch
-            offset += current_batch_size
+                # A short batch means there are no candidates left
+                if len(events) < current_batch_size:
+                    break
+    finally:
+        if service is not None:
+            await service.close()
+        if cache is not None:
+            cache.close()
     
     # Print summary
     logger.info(f"Geocoding complete. Processed {total_processed} events, successfully geocoded {total_geocoded}.")
@@ -10,31 +10,97 @@ geocoding_attempted flag to track which events have been processed.
 import argparse
 import asyncio
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from geopy.exc import GeocoderRateLimited, GeocoderTimedOut, GeocoderUnavailable
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import selectinload
+from tenacity import retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
-from app.db.session import get_db
+from app.config import get_settings
 from app.models.event import Event
-from app.services.geocoding import geocode_location
+from app.services.geocoding import GeocodeCache, GeocodingService, RequestThrottle
+from app.services.geocoding.cache import normalize_address_key
 from app.logging_config import get_logger
 
 # Setup logging
 logger = get_logger("scripts.selective_geocoding")
 
-async def find_events_needing_geocoding(db: AsyncSession, limit: Optional[int] = None) -> List[Event]:
+# Errors worth retrying: rate limiting, timeouts and connection failures.
+# geopy's adapter raises these for aiohttp timeouts and connection errors.
+# If they persist the event is left unmarked so a later run retries it.
+TRANSIENT_GEOCODING_ERRORS = (
+    GeocoderRateLimited,
+    GeocoderTimedOut,
+    GeocoderUnavailable,
+)
+
+# GeocodingService.geocode_address with its retry policy swapped for
+# jittered backoff on transient errors only. reraise=True surfaces the last
+# error itself rather than tenacity's RetryError. Each attempt's requests
+# still wait on the service's throttle.
+_geocode_address_with_backoff = GeocodingService.geocode_address.retry_with(
+    retry=retry_if_exception_type(TRANSIENT_GEOCODING_ERRORS),
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+
+# Recycle pooled connections after this many seconds so long runs don't
+# hold on to connections the server or a proxy has since dropped
+POOL_RECYCLE_SECONDS = 1800
+
+# Fill in coordinates already present (as non-zero numbers) in event_details
+COPY_DETAIL_COORDINATES = text("""
+    UPDATE events
+    SET latitude = (event_details->'coordinates'->>'latitude')::float,
+        longitude = (event_details->'coordinates'->>'longitude')::float,
+        geocoding_attempted = true
+    WHERE latitude IS NULL
+      AND longitude IS NULL
+      AND jsonb_typeof(event_details->'coordinates'->'latitude') = 'number'
+      AND jsonb_typeof(event_details->'coordinates'->'longitude') = 'number'
+      AND (event_details->'coordinates'->>'latitude')::float <> 0
+      AND (event_details->'coordinates'->>'longitude')::float <> 0
+""")
+
+async def copy_detail_coordinates(db: AsyncSession) -> int:
     """
-    Find events that need geocoding (have no coordinates and geocoding hasn't been attempted).
+    Copy coordinates already stored in event_details onto the event columns.
+    
+    Events whose details already carry coordinates need no geocoding, so
+    they are filled in with a single statement before any lookups.
     
     Args:
         db: Database session
-        limit: Optional limit on number of events to process
         
     Returns:
-        List of Event objects
+        Number of events updated
+    """
+    result = await db.execute(COPY_DETAIL_COORDINATES)
+    if result.rowcount:
+        logger.info(f"Copied coordinates from event_details for {result.rowcount} events")
+    return result.rowcount
+
+async def find_events_needing_geocoding(db: AsyncSession, batch_size: int = 10,
+                                        after_id: Optional[int] = None) -> List[Event]:
+    """
+    Find the next page of events that need geocoding (have no coordinates and geocoding hasn't been attempted).
+    
+    Pages are fetched by keyset on the primary key, so each is a short query
+    and no cursor is held open while the previous page is geocoded.
+    
+    Args:
+        db: Database session
+        batch_size: Number of events to fetch
+        after_id: Id of the last event on the previous page, or None for
+            the first page
+        
+    Returns:
+        List of Event objects needing geocoding, in id order
     """
     query = (
         select(Event)
@@ -43,27 +109,59 @@ async def find_events_needing_geocoding(db: AsyncSession, limit: Optional[int] =
             (Event.longitude == None) & 
             (Event.geocoding_attempted == False)
         )
-        .order_by(Event.date_start.desc())
+        .order_by(Event.id)
+        .limit(batch_size)
     )
     
-    if limit:
-        query = query.limit(limit)
-        
-    result = await db.execute(query)
-    events = result.scalars().all()
+    # Resume after the previous page. Events left unmarked by a transient
+    # failure still match the filter but are not fetched again this run.
+    if after_id is not None:
+        query = query.where(Event.id > after_id)
     
-    logger.info(f"Found {len(events)} events that need geocoding")
-    return events
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+@lru_cache(maxsize=10_000)
+def _normalize_location(location: str, city: Optional[str], state: Optional[str],
+                        country: str) -> str:
+    """Build the location string to geocode, preferring city/state details."""
+    if city and state:
+        return f"{city}, {state}, {country}"
+    elif city:
+        return f"{city}, {country}"
+    return location
+
+async def _geocode_with_retry(service: GeocodingService, location: str) -> Optional[Tuple[float, float]]:
+    """Geocode a location, backing off and retrying transient failures."""
+    return await _geocode_address_with_backoff(service, location)
 
-async def geocode_event(event: Event) -> Tuple[bool, Optional[float], Optional[float]]:
+async def _geocode_and_cache(service: GeocodingService, location: str,
+                             cache: Optional[GeocodeCache] = None) -> Optional[Tuple[float, float]]:
+    """Geocode a location and record the result in the persistent cache."""
+    coords = await _geocode_with_retry(service, location)
+    if cache is not None:
+        cache.store(location, tuple(coords) if coords else None)
+    return coords
+
+async def geocode_event(event: Event, service: GeocodingService,
+                        cache: Optional[GeocodeCache] = None,
+                        inflight: Optional[Dict[str, asyncio.Task]] = None) -> Tuple[bool, Optional[float], Optional[float]]:
     """
     Attempt to geocode an event based on its location.
     
     Args:
         event: Event to geocode
+        service: Geocoding service used for lookups
+        cache: Optional persistent cache checked before calling the geocoder
+        inflight: Optional map of normalized location to the lookup task
+            already running for it, shared across the run
         
     Returns:
         Tuple of (success, latitude, longitude)
+        
+    Raises:
+        One of TRANSIENT_GEOCODING_ERRORS if the geocoder kept failing
+        transiently after all retries
     """
     logger.info(f"Geocoding event: {event.name} ({event.id}) - Location: {event.location}")
     
@@ -74,30 +172,42 @@ async def geocode_event(event: Event) -> Tuple[bool, Optional[float], Optional[f
     if event.event_details and "location_details" in event.event_details:
         location_details = event.event_details["location_details"]
         
-    # Build a more precise location string if we have details
+    # Build a more precise location string if we have details. Only the
+    # hashable strings are passed so repeated addresses hit the memo.
     if location_details:
-        city = location_details.get("city")
-        state = location_details.get("state")
-        country = location_details.get("country", "USA")
-        
-        if city and state:
-            location = f"{city}, {state}, {country}"
-        elif city:
-            location = f"{city}, {country}"
-            
-    # Check if coordinates are already in event_details
-    if event.event_details and "coordinates" in event.event_details:
-        coords = event.event_details["coordinates"]
-        if "latitude" in coords and "longitude" in coords:
-            lat = coords["latitude"]
-            lng = coords["longitude"]
-            if lat and lng:
-                logger.info(f"Using coordinates from event_details: {lat}, {lng}")
+        location = _normalize_location(
+            location,
+            location_details.get("city"),
+            location_details.get("state"),
+            location_details.get("country", "USA")
+        )
+    
+    # Reuse a previous result for the same location when we have one
+    if cache is not None:
+        hit, coords = cache.lookup(location)
+        if hit:
+            if coords:
+                lat, lng = coords
+                logger.info(f"Using cached coordinates for {location}: {lat}, {lng}")
                 return True, lat, lng
+            logger.info(f"Skipping location that previously failed to geocode: {location}")
+            return False, None, None
     
-    # Attempt geocoding
+    # Attempt geocoding. Events sharing a location await a single in-flight
+    # lookup instead of each querying the geocoder. Finished lookups leave
+    # the map, so later events with the location read the cache instead and
+    # one that failed transiently is tried afresh.
     try:
-        coords = await geocode_location(location)
+        if inflight is None:
+            coords = await _geocode_and_cache(service, location, cache)
+        else:
+            key = normalize_address_key(location)
+            task = inflight.get(key)
+            if task is None:
+                task = inflight[key] = asyncio.create_task(_geocode_and_cache(service, location, cache))
+                task.add_done_callback(lambda _: inflight.pop(key, None))
+            coords = await task
+        
         if coords:
             lat, lng = coords
             logger.info(f"Successfully geocoded to: {lat}, {lng}")
@@ -105,69 +215,61 @@ async def geocode_event(event: Event) -> Tuple[bool, Optional[float], Optional[f
         else:
             logger.warning(f"Geocoding failed for: {location}")
             return False, None, None
+    except TRANSIENT_GEOCODING_ERRORS:
+        # Leave the event eligible for the next run
+        raise
     except Exception as e:
         logger.error(f"Error during geocoding: {str(e)}")
         return False, None, None
 
-async def update_event_coordinates(db: AsyncSession, event: Event, 
-                                  lat: Optional[float], lng: Optional[float],
-                                  geocoding_attempted: bool = True) -> bool:
+def _build_update_row(event: Event, lat: Optional[float], lng: Optional[float],
+                      geocoding_attempted: bool = True) -> Dict[str, Any]:
     """
-    Update event with geocoding results.
+    Build the bulk-update parameters recording an event's geocoding results.
     
     Args:
-        db: Database session
-        event: Event to update
+        event: Event that was geocoded
         lat: Latitude (or None if geocoding failed)
         lng: Longitude (or None if geocoding failed)
         geocoding_attempted: Flag to indicate geocoding was attempted
         
     Returns:
-        True if update was successful
+        Dictionary of column values keyed by attribute name, including the id
     """
-    try:
-        # Update coordinates
-        event.latitude = lat
-        event.longitude = lng
-        event.geocoding_attempted = geocoding_attempted
-        
-        # Update event_details if they exist
-        if event.event_details is None:
-            event.event_details = {}
-            
-        # Add or update coordinates in event_details
-        if lat is not None and lng is not None:
-            event.event_details["coordinates"] = {
-                "latitude": lat,
-                "longitude": lng
-            }
-            
-        # Set geocoding_attempted in event_details too for consistency
-        event.event_details["geocoding_attempted"] = geocoding_attempted
-        
-        # Mark for update
-        event.updated_at = datetime.now()
-        
-        # Commit changes
-        await db.commit()
+    # Copy event_details so the new value is written as a whole
+    event_details = dict(event.event_details or {})
+    
+    # Add or update coordinates in event_details
+    if lat is not None and lng is not None:
+        event_details["coordinates"] = {
+            "latitude": lat,
+            "longitude": lng
+        }
         
-        logger.info(f"Updated event {event.id} with geocoding results")
-        return True
-    except Exception as e:
-        await db.rollback()
-        logger.error(f"Error updating event {event.id}: {str(e)}")
-        return False
+    # Set geocoding_attempted in event_details too for consistency
+    event_details["geocoding_attempted"] = geocoding_attempted
+    
+    return {
+        "id": event.id,
+        "latitude": lat,
+        "longitude": lng,
+        "geocoding_attempted": geocoding_attempted,
+        "event_details": event_details,
+        "updated_at": datetime.now(),
+    }
 
 async def process_events(limit: Optional[int] = None, 
                         batch_size: int = 10,
-                        sleep_between_batches: int = 2) -> Dict[str, int]:
+                        requests_per_second: float = 1.0,
+                        concurrency: int = 5) -> Dict[str, int]:
     """
     Process events that need geocoding.
     
     Args:
         limit: Maximum number of events to process
         batch_size: Number of events to process in each batch
-        sleep_between_batches: Seconds to sleep between batches
+        requests_per_second: Maximum sustained rate of geocoding requests
+        concurrency: Maximum number of geocoding requests in flight at once
         
     Returns:
         Dictionary with metrics
@@ -179,62 +281,121 @@ async def process_events(limit: Optional[int] = None,
         "error": 0
     }
     
-    # Connect to DB
-    db_gen = get_db()
-    db = await anext(db_gen)
+    # The semaphore bounds requests in flight; the throttle paces every
+    # request the service sends
+    semaphore = asyncio.Semaphore(concurrency)
+    service = GeocodingService(RequestThrottle(requests_per_second))
+    inflight: Dict[str, asyncio.Task] = {}
     
-    try:
-        # Get events that need geocoding
-        events = await find_events_needing_geocoding(db, limit)
-        total_events = len(events)
-        metrics["total"] = total_events
+    # Load previously geocoded locations once up front
+    cache = GeocodeCache()
+    cache.preload()
+    
+    # One engine for the run, sized to the concurrency limit, with statement
+    # logging off regardless of the app's DEBUG setting
+    engine = create_async_engine(
+        get_settings().DATABASE_URL,
+        pool_size=concurrency,
+        max_overflow=concurrency,
+        pool_recycle=POOL_RECYCLE_SECONDS,
+        echo=False,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    
+    async def geocode_bounded(event: Event) -> Tuple[bool, Optional[float], Optional[float]]:
+        """Geocode an event once a concurrency slot is free."""
+        async with semaphore:
+            return await geocode_event(event, service, cache, inflight)
+    
+    async def geocode_batch(batch: List[Event], batch_number: int) -> None:
+        """Geocode and update one batch of events."""
+        logger.info(f"Processing batch {batch_number}")
         
-        if total_events == 0:
-            logger.info("No events found that need geocoding")
-            return metrics
-            
-        # Process in batches to avoid overwhelming geocoding service
-        for i in range(0, total_events, batch_size):
-            batch = events[i:i+batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(total_events+batch_size-1)//batch_size}")
+        # Geocode the whole batch concurrently
+        results = await asyncio.gather(
+            *(geocode_bounded(event) for event in batch),
+            return_exceptions=True
+        )
+        
+        updates: List[Dict[str, Any]] = []
+        successful = 0
+        for event, result in zip(batch, results):
+            if isinstance(result, Exception):
+                metrics["error"] += 1
+                logger.error(f"Error processing event {event.id}: {str(result)}")
+                continue
             
-            for event in batch:
-                try:
-                    # Attempt geocoding
-                    success, lat, lng = await geocode_event(event)
-                    
-                    # Update the event
-                    update_success = await update_event_coordinates(db, event, lat, lng, True)
-                    
-                    if update_success:
-                        metrics["processed"] += 1
-                        if success:
-                            metrics["successful"] += 1
-                        else:
-                            metrics["failed"] += 1
-                    else:
-                        metrics["error"] += 1
-                        
-                except Exception as e:
-                    metrics["error"] += 1
-                    logger.error(f"Error processing event {event.id}: {str(e)}")
+            success, lat, lng = result
+            updates.append(_build_update_row(event, lat, lng, True))
+            if success:
+                successful += 1
+        
+        # Write the batch with one executemany UPDATE by primary key and
+        # commit it, so a failure rolls back only this batch. The commit runs
+        # even with nothing to write so no transaction spans batches.
+        try:
+            if updates:
+                await db.execute(update(Event), updates)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            metrics["error"] += len(updates)
+            logger.error(f"Error updating batch {batch_number}: {str(e)}")
+            return
+        
+        logger.info(f"Updated {len(updates)} events with geocoding results")
+        metrics["processed"] += len(updates)
+        metrics["successful"] += successful
+        metrics["failed"] += len(updates) - successful
+    
+    try:
+        async with async_session() as db:
+            await copy_detail_coordinates(db)
+            await db.commit()
             
-            # Sleep between batches to avoid rate limits
-            if i + batch_size < total_events and sleep_between_batches > 0:
-                logger.info(f"Sleeping for {sleep_between_batches} seconds before next batch")
-                await asyncio.sleep(sleep_between_batches)
+            # Fetch events that need geocoding a page at a time, processing
+            # each page in its own short transaction to avoid overwhelming
+            # the geocoding service
+            total_events = 0
+            batch_number = 0
+            after_id = None
+            remaining = limit
+            while remaining is None or remaining > 0:
+                current_batch_size = batch_size if remaining is None else min(batch_size, remaining)
+                
+                batch = await find_events_needing_geocoding(db, current_batch_size, after_id)
+                if not batch:
+                    break
+                after_id = batch[-1].id
+                
+                total_events += len(batch)
+                batch_number += 1
+                await geocode_batch(batch, batch_number)
                 
-        return metrics
+                if remaining is not None:
+                    remaining -= len(batch)
+                
+                # A short page means there are no candidates left
+                if len(batch) < current_batch_size:
+                    break
+        
+            metrics["total"] = total_events
+            if total_events == 0:
+                logger.info("No events found that need geocoding")
+            return metrics
     
     finally:
-        await db.close()
+        await service.close()
+        await engine.dispose()
+        cache.close()
 
 async def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Selectively geocode events that don't have coordinates")
     parser.add_argument("--limit", type=int, help="Maximum number of events to process")
     parser.add_argument("--batch-size", type=int, default=10, help="Number of events to process in each batch")
-    parser.add_argument("--sleep", type=int, default=2, help="Seconds to sleep between batches")
+    parser.add_argument("--rate", type=float, default=1.0, help="Maximum geocoding requests per second")
+    parser.add_argument("--concurrency", type=int, default=5, help="Maximum concurrent geocoding requests")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     
     args = parser.parse_args()
@@ -245,7 +406,7 @@ async def main():
     
     # Process events
     logger.info("Starting selective geocoding process")
-    metrics = await process_events(args.limit, args.batch_size, args.sleep)
+    metrics = await process_events(args.limit, args.batch_size, args.rate, args.concurrency)
     
     # Print summary
     logger.info(f"Geocoding process complete. Summary:")
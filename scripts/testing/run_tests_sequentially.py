@@ -1,21 +1,25 @@
 #!/usr/bin/env python3
 """
-Run tests sequentially to avoid event loop issues.
+Run the event API tests.
 
-This script runs each test in the test_events.py file one by one
-to avoid issues with the event loop when running multiple tests.
+By default every test in test_events.py runs in a single pytest invocation,
+so Docker and interpreter start-up is paid once. Pass --sequential to run each test in its own invocation, one by one,
+when debugging event loop issues.
 """
+import argparse
 import subprocess
 import sys
 import os
 
+TEST_FILE = "tests/api/test_events.py"
+
 def run_test(test_name):
     """Run a specific test using make test-dev."""
     print(f"\n\n{'='*80}")
     print(f"Running test: {test_name}")
     print(f"{'='*80}\n")
     
-    cmd = f"make test-dev PYTEST_ARGS=\"-xvs tests/api/test_events.py::{test_name}\""
+    cmd = f"make test-dev PYTEST_ARGS=\"-xvs {TEST_FILE}::{test_name}\""
     result = subprocess.run(cmd, shell=True)
     
     if result.returncode != 0:
@@ -25,8 +29,27 @@ def run_test(test_name):
         print(f"\n\nTest {test_name} PASSED")
         return True
 
+def run_all():
+    """Run all tests in test_events.py in one pytest invocation."""
+    cmd = f"make test-dev PYTEST_ARGS=\"-v {TEST_FILE}\""
+    result = subprocess.run(cmd, shell=True)
+    
+    if result.returncode != 0:
+        print(f"\n\nTests FAILED with exit code {result.returncode}")
+    else:
+        print("\n\nAll tests passed!")
+    return result.returncode
+
 def main():
-    """Run all tests in test_events.py sequentially."""
+    """Run all tests in test_events.py, sequentially if requested."""
+    parser = argparse.ArgumentParser(description="Run the event API tests")
+    parser.add_argument("--sequential", action="store_true",
+                        help="Run each test in its own pytest invocation, one by one")
+    args = parser.parse_args()
+    
+    if not args.sequential:
+        return run_all()
+    
     tests = [
         "test_read_events",
         "test_create_event",
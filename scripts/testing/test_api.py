@@ -5,104 +5,123 @@ Test the API endpoints directly.
 This script tests the API endpoints directly by making HTTP requests
 to a running API instance. It's useful for testing the API without
 going through the test framework.
+
+Independent tests run concurrently over one shared keep-alive client;
+steps within a test that depend on each other still run in order.
 """
-import requests
-import json
+import asyncio
 import sys
 from datetime import datetime
+from typing import List
+
+import httpx
 
 # Base URL for the API
 BASE_URL = "http://localhost:8000/api/v1"
 
-def test_health():
+# Seconds before a request is considered failed
+REQUEST_TIMEOUT = 10.0
+
+# Taken once per run so every payload shares one timestamp while event
+# names stay unique across runs
+RUN_TIMESTAMP = datetime.now().isoformat()
+
+async def test_health(client: httpx.AsyncClient, out: List[str]) -> bool:
     """Test the health endpoint."""
-    url = f"{BASE_URL}/health"
-    response = requests.get(url)
+    response = await client.get("/health")
     
     if response.status_code == 200:
-        print(f"✅ Health check passed: {response.json()}")
+        out.append(f"✅ Health check passed: {response.json()}")
         return True
     else:
-        print(f"❌ Health check failed: {response.status_code}")
+        out.append(f"❌ Health check failed: {response.status_code}")
         return False
 
-def test_events():
+async def test_events(client: httpx.AsyncClient, out: List[str]) -> bool:
     """Test the events endpoints."""
     # Test GET /events
-    url = f"{BASE_URL}/events"
-    response = requests.get(url)
+    url = "/events"
+    response = await client.get(url)
     
     if response.status_code == 200:
         events = response.json()
-        print(f"✅ GET /events returned {len(events)} events")
+        out.append(f"✅ GET /events returned {len(events)} events")
     else:
-        print(f"❌ GET /events failed: {response.status_code}")
+        out.append(f"❌ GET /events failed: {response.status_code}")
         return False
     
     # Test POST /events
     event_data = {
-        "name": f"Test Event {datetime.now().isoformat()}",
+        "name": f"Test Event {RUN_TIMESTAMP}",
         "location": "Test Location",
-        "date_start": datetime.now().isoformat(),
+        "date_start": RUN_TIMESTAMP,
         "region": "Test Region",
         "source": "TEST"
     }
     
-    response = requests.post(url, json=event_data)
+    response = await client.post(url, json=event_data)
     
     if response.status_code == 201:
         event = response.json()
-        print(f"✅ POST /events created event with ID {event['id']}")
+        out.append(f"✅ POST /events created event with ID {event['id']}")
         event_id = event["id"]
     else:
-        print(f"❌ POST /events failed: {response.status_code}")
+        out.append(f"❌ POST /events failed: {response.status_code}")
         return False
     
     # Test GET /events/{id}
-    url = f"{BASE_URL}/events/{event_id}"
-    response = requests.get(url)
+    url = f"/events/{event_id}"
+    response = await client.get(url)
     
     if response.status_code == 200:
         event = response.json()
-        print(f"✅ GET /events/{event_id} returned event: {event['name']}")
+        out.append(f"✅ GET /events/{event_id} returned event: {event['name']}")
     else:
-        print(f"❌ GET /events/{event_id} failed: {response.status_code}")
+        out.append(f"❌ GET /events/{event_id} failed: {response.status_code}")
         return False
     
     # Test PUT /events/{id}
     update_data = {
-        "name": f"Updated Event {datetime.now().isoformat()}"
+        "name": f"Updated Event {RUN_TIMESTAMP}"
     }
     
-    response = requests.put(url, json=update_data)
+    response = await client.put(url, json=update_data)
     
     if response.status_code == 200:
         event = response.json()
-        print(f"✅ PUT /events/{event_id} updated event: {event['name']}")
+        out.append(f"✅ PUT /events/{event_id} updated event: {event['name']}")
     else:
-        print(f"❌ PUT /events/{event_id} failed: {response.status_code}")
+        out.append(f"❌ PUT /events/{event_id} failed: {response.status_code}")
         return False
     
     # Test DELETE /events/{id}
-    response = requests.delete(url)
+    response = await client.delete(url)
     
     if response.status_code == 204:
-        print(f"✅ DELETE /events/{event_id} deleted event")
+        out.append(f"✅ DELETE /events/{event_id} deleted event")
     else:
-        print(f"❌ DELETE /events/{event_id} failed: {response.status_code}")
+        out.append(f"❌ DELETE /events/{event_id} failed: {response.status_code}")
         return False
     
     # Verify event was deleted
-    response = requests.get(url)
+    response = await client.get(url)
     
     if response.status_code == 404:
-        print(f"✅ GET /events/{event_id} verified event was deleted")
+        out.append(f"✅ GET /events/{event_id} verified event was deleted")
         return True
     else:
-        print(f"❌ GET /events/{event_id} failed to verify deletion: {response.status_code}")
+        out.append(f"❌ GET /events/{event_id} failed to verify deletion: {response.status_code}")
         return False
 
-def main():
+async def run_test(test_func, client: httpx.AsyncClient, out: List[str]) -> bool:
+    """Run a single test, recording a connection failure as a failed test."""
+    try:
+        return await test_func(client, out)
+    except httpx.HTTPError as e:
+        out.append(f"❌ Request failed: {e}")
+        return False
+
+async def main():
     """Run all API tests."""
     print("Testing TrailBlaze API...")
     
@@ -111,11 +130,27 @@ def main():
         ("Events API", test_events)
     ]
     
+    # Each test buffers its own output so concurrent runs don't interleave
+    outputs: List[List[str]] = [[] for _ in tests]
+    
+    # One client for the whole run so connections are reused across requests
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=REQUEST_TIMEOUT,
+        headers={"Accept": "application/json"}
+    ) as client:
+        results = await asyncio.gather(*(
+            run_test(test_func, client, out)
+            for (_, test_func), out in zip(tests, outputs)
+        ))
+    
     failed_tests = []
     
-    for name, test_func in tests:
+    for (name, _), out, passed in zip(tests, outputs, results):
         print(f"\n--- Testing {name} ---")
-        if not test_func():
+        for line in out:
+            print(line)
+        if not passed:
             failed_tests.append(name)
     
     print("\n--- Test Summary ---")
@@ -133,4 +168,4 @@ def main():
         return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
@@ -16,12 +16,12 @@ import sys
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db.session import async_session
+from app.database import async_session
 from app.models.event import Event
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -30,17 +30,28 @@ from sqlalchemy.ext.asyncio import AsyncSession
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-async def get_all_events(session: AsyncSession) -> List[Event]:
-    """Get all events from the database."""
-    result = await session.execute(select(Event))
-    events = result.scalars().all()
-    logger.info(f"Retrieved {len(events)} events from database")
-    return events
+# Rows fetched per round trip while streaming events
+STREAM_YIELD_PER = 500
 
-async def update_event_structure(event: Event, session: AsyncSession) -> None:
-    """Update an event to match the new data structure."""
+async def get_all_events(session: AsyncSession) -> AsyncIterator[Event]:
+    """Stream all events from the database through a server-side cursor."""
+    stream = await session.stream_scalars(
+        select(Event).execution_options(yield_per=STREAM_YIELD_PER)
+    )
+    async for event in stream:
+        yield event
+
+def get_event_structure_changes(event: Event) -> Dict[str, Any]:
+    """
+    Work out the column changes an event needs to match the new data structure.
+    
+    Returns:
+        Changed column values keyed by attribute name; empty if the event is
+        already up to date
+    """
     changes = {}
-    event_details = event.event_details or {}
+    # Work on a copy so the loaded instance is left untouched
+    event_details = dict(event.event_details or {})
     
     # Extract ride_id from event_details if available
     if "ride_id" in event_details and not event.ride_id:
@@ -50,51 +61,44 @@ async def update_event_structure(event: Event, session: AsyncSession) -> None:
     if "has_intro_ride" in event_details and event.has_intro_ride is None:
         changes["has_intro_ride"] = event_details["has_intro_ride"]
     
-    # Ensure distances are in the correct format in event_details
-    if "distances" in event_details and isinstance(event_details["distances"], list):
-        structured_distances = []
-        for dist in event_details["distances"]:
-            if isinstance(dist, str):
-                # Convert simple string to structured format
-                structured_distances.append({
-                    "distance": dist,
-                    "date": event.date_start.strftime("%b %d, %Y") if event.date_start else None,
-                    "start_time": None
-                })
-            elif isinstance(dist, dict) and "distance" in dist:
-                # Already in structured format
-                structured_distances.append(dist)
-        
-        if structured_distances:
-            event_details["distances"] = structured_distances
-            changes["event_details"] = event_details
+    # Only format the date once; it is the same for every distance
+    date_str = event.date_start.strftime("%b %d, %Y") if event.date_start else None
     
-    # Ensure control_judges are in the correct format
-    if "control_judges" in event_details and isinstance(event_details["control_judges"], list):
-        control_judges = []
-        for judge in event_details["control_judges"]:
-            if isinstance(judge, str):
-                # Convert simple string to structured format
-                control_judges.append({
-                    "name": judge,
-                    "role": "Control Judge"
-                })
-            elif isinstance(judge, dict) and "name" in judge:
-                # Already in structured format
-                control_judges.append(judge)
+    # Ensure distances and control_judges follow the structured format,
+    # mapping each collection to its required key and a converter for
+    # plain string entries
+    structured_formats = {
+        "distances": ("distance", lambda dist: {
+            "distance": dist,
+            "date": date_str,
+            "start_time": None
+        }),
+        "control_judges": ("name", lambda judge: {
+            "name": judge,
+            "role": "Control Judge"
+        }),
+    }
+    
+    for key, (required_key, from_string) in structured_formats.items():
+        raw = event_details.get(key)
+        # Skip collections that are already fully structured, so re-runs
+        # leave event_details untouched
+        if not raw or not isinstance(raw, list) or all(
+            isinstance(item, dict) and required_key in item for item in raw
+        ):
+            continue
+        
+        structured = [
+            from_string(item) if isinstance(item, str) else item
+            for item in raw
+            if isinstance(item, str) or (isinstance(item, dict) and required_key in item)
+        ]
         
-        if control_judges:
-            event_details["control_judges"] = control_judges
+        if structured:
+            event_details[key] = structured
             changes["event_details"] = event_details
     
-    # Update the event if changes are needed
-    if changes:
-        await session.execute(
-            update(Event)
-            .where(Event.id == event.id)
-            .values(**changes)
-        )
-        logger.info(f"Updated event {event.id}: {event.name} with {list(changes.keys())}")
+    return changes
 
 async def main():
     """Main function to update all events."""
@@ -102,13 +106,24 @@ async def main():
     
     async with async_session() as session:
         try:
-            events = await get_all_events(session)
+            # Collect every change first, then write them with one bulk
+            # UPDATE by primary key instead of a statement per event
+            bulk_rows: List[Dict[str, Any]] = []
+            total_events = 0
+            async for event in get_all_events(session):
+                total_events += 1
+                changes = get_event_structure_changes(event)
+                if changes:
+                    bulk_rows.append({"id": event.id, **changes})
+                    logger.info(f"Updating event {event.id}: {event.name} with {list(changes.keys())}")
+            
+            logger.info(f"Retrieved {total_events} events from database")
             
-            for event in events:
-                await update_event_structure(event, session)
+            if bulk_rows:
+                await session.execute(update(Event), bulk_rows)
             
             await session.commit()
-            logger.info("All events updated successfully")
+            logger.info(f"All events updated successfully ({len(bulk_rows)} changed)")
         
         except Exception as e:
             await session.rollback()